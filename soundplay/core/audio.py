@@ -13,16 +13,21 @@ Pipe protocol (raw PCM via stdin/stdout):
   - Body: float32 little-endian samples, interleaved by channel
 """
 
+import functools
+import io
+import os
+import stat
 import sys
 import struct
 import numpy as np
-import soundfile as sf
 from dataclasses import dataclass
 from pathlib import Path
 
 PIPE_MAGIC = b'SPAW'
 PIPE_HEADER_FMT = '<4sIII'
 PIPE_HEADER_SIZE = struct.calcsize(PIPE_HEADER_FMT)  # 16 bytes
+PIPE_CHUNK_SIZE = 65536  # bytes per write — one Linux pipe buffer
+_CONVERT_BLOCK_BYTES = 1 << 20  # bytes of samples made contiguous at a time for strided writes
 
 
 @dataclass
@@ -45,13 +50,20 @@ class AudioData:
     def as_mono(self) -> 'AudioData':
         if self.channels == 1:
             return self
-        return AudioData(self.samples.mean(axis=1, keepdims=True).astype(np.float32), self.sample_rate)
+        if self.samples.strides[1] == 0:
+            # Every channel aliases the same data (e.g. from as_stereo) — nothing to average
+            return AudioData(self.samples[:, :1].copy(), self.sample_rate)
+        # float32 matrix-vector product: no float64 promotion as with .mean()
+        weights = np.full((self.channels, 1), 1.0 / self.channels, dtype=np.float32)
+        mono = self.samples @ weights
+        return AudioData(mono.astype(np.float32, copy=False), self.sample_rate)
 
     def as_stereo(self) -> 'AudioData':
         if self.channels == 2:
             return self
         if self.channels == 1:
-            return AudioData(np.repeat(self.samples, 2, axis=1), self.sample_rate)
+            # Read-only zero-copy view: both channels share the mono buffer
+            return AudioData(np.broadcast_to(self.samples, (self.frames, 2)), self.sample_rate)
         raise ValueError(f"Cannot convert {self.channels}-channel audio to stereo directly")
 
 
@@ -63,69 +75,197 @@ def load(path: str | Path) -> AudioData:
     path = Path(path)
     if path.suffix.lower() in _PYDUB_FORMATS:
         return _load_via_pydub(path)
+    import soundfile as sf  # deferred: pipe-only runs never touch libsndfile
     data, sr = sf.read(str(path), dtype='float32', always_2d=True)
     return AudioData(data, sr)
 
 
+def probe(path: str | Path) -> tuple[int, int, int] | None:
+    """
+    (frames, channels, sample_rate) read from the file header without decoding
+    samples, or None for formats only a full pydub decode can measure.
+    """
+    path = Path(path)
+    if path.suffix.lower() in _PYDUB_FORMATS:
+        return None
+    import soundfile as sf
+    info = sf.info(str(path))
+    return info.frames, info.channels, info.samplerate
+
+
 def _load_via_pydub(path: Path) -> AudioData:
     from pydub import AudioSegment
     seg = AudioSegment.from_file(str(path))
     sr = seg.frame_rate
     channels = seg.channels
-    raw = np.array(seg.get_array_of_samples(), dtype=np.int16)
-    samples = raw.reshape(-1, channels).astype(np.float32) / 32768.0
+    width = seg.sample_width
+    if width == 3:
+        # numpy has no 24-bit int: place each sample in the top three bytes of
+        # an int32, which keeps the sign and scales it by 2**8
+        packed = np.frombuffer(seg.raw_data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(packed), 4), dtype=np.uint8)
+        padded[:, 1:] = packed
+        raw = padded.view('<i4').reshape(-1, channels)
+        width = 4
+    else:
+        # Zero-copy view of pydub's PCM buffer
+        raw = np.frombuffer(seg.raw_data, dtype=f'<i{width}').reshape(-1, channels)
+    # Scaled into float32 in a single pass
+    samples = np.empty(raw.shape, dtype=np.float32)
+    np.multiply(raw, np.float32(1.0 / (1 << (8 * width - 1))), out=samples, casting='unsafe')
     return AudioData(samples, sr)
 
 
+def _sf_format(path: Path, format: str | None) -> tuple[str, str]:
+    """(soundfile format, subtype) for an output path. Format inferred from extension if not given."""
+    fmt = format or path.suffix.lstrip('.').upper()
+    if fmt == 'WAV':
+        return 'WAV', 'PCM_16'
+    if fmt == 'FLAC':
+        return 'FLAC', 'PCM_24'
+    if fmt in ('OGG', 'VORBIS'):
+        return 'OGG', 'VORBIS'
+    raise ValueError(f"Unsupported output format: {fmt}")
+
+
 def save(audio: AudioData, path: str | Path, format: str | None = None) -> None:
     """Save audio to a file. Format inferred from extension if not given."""
     path = Path(path)
-    fmt = format or path.suffix.lstrip('.').upper()
-    if fmt == 'WAV':
-        sf_format = 'WAV'
-        subtype = 'PCM_16'
-    elif fmt == 'FLAC':
-        sf_format = 'FLAC'
-        subtype = 'PCM_24'
-    elif fmt in ('OGG', 'VORBIS'):
-        sf_format = 'OGG'
-        subtype = 'VORBIS'
-    else:
-        raise ValueError(f"Unsupported output format: {fmt}")
-    sf.write(str(path), audio.samples, audio.sample_rate, format=sf_format, subtype=subtype)
+    sf_format, subtype = _sf_format(path, format)
+    import soundfile as sf
+    samples = audio.samples
+    if samples.flags['C_CONTIGUOUS']:
+        sf.write(str(path), samples, audio.sample_rate, format=sf_format, subtype=subtype)
+        return
+    # libsndfile needs C-contiguous buffers: hand strided views (e.g. reversed)
+    # over a block at a time rather than copying the whole signal
+    rows = max(1, _CONVERT_BLOCK_BYTES // max(samples[:1].size * samples.itemsize, 1))
+    with sf.SoundFile(str(path), 'w', audio.sample_rate, audio.channels,
+                      subtype=subtype, format=sf_format) as f:
+        for t0 in range(0, len(samples), rows):
+            f.write(np.ascontiguousarray(samples[t0:t0 + rows]))
 
 
-def read_pipe(stream=None) -> AudioData:
-    """Read AudioData from a pipe stream (default: stdin binary)."""
-    if stream is None:
-        stream = sys.stdin.buffer
+def _pipe_fd(stream) -> int | None:
+    """File descriptor behind a buffered pipe reader (e.g. piped stdin), else None."""
+    if not isinstance(stream, io.BufferedReader) or not hasattr(os, 'readv'):
+        return None
+    try:
+        fd = stream.fileno()
+        return fd if stat.S_ISFIFO(os.fstat(fd).st_mode) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _readinto_full(stream, buf: memoryview) -> int:
+    """Fill buf from stream, looping over short reads. Returns bytes read (< len(buf) at EOF)."""
+    got = 0
+    fd = _pipe_fd(stream)
+    if fd is not None:
+        # Take what BufferedReader already holds, then read the pipe directly into
+        # buf so large bodies skip its intermediate buffer
+        pending = len(stream.peek(0))
+        got = stream.readinto(buf[:min(pending, len(buf))])
+        while got < len(buf):
+            n = os.readv(fd, [buf[got:]])
+            if not n:
+                break
+            got += n
+        return got
+    while got < len(buf):
+        n = stream.readinto(buf[got:])
+        if not n:
+            break
+        got += n
+    return got
+
+
+def _read_header(stream) -> tuple[int, int, int]:
+    """Read and validate a pipe header. Returns (sample_rate, channels, frames)."""
     header = stream.read(PIPE_HEADER_SIZE)
     if len(header) < PIPE_HEADER_SIZE:
         raise ValueError("Incomplete pipe header")
     magic, sr, channels, frames = struct.unpack(PIPE_HEADER_FMT, header)
     if magic != PIPE_MAGIC:
         raise ValueError(f"Invalid pipe magic: {magic!r} (expected {PIPE_MAGIC!r})")
+    return sr, channels, frames
+
+
+def _write_header(stream, sample_rate: int, channels: int, frames: int) -> None:
+    stream.write(struct.pack(PIPE_HEADER_FMT, PIPE_MAGIC, sample_rate, channels, frames))
+
+
+def read_pipe(stream=None) -> AudioData:
+    """Read AudioData from a pipe stream (default: stdin binary)."""
+    if stream is None:
+        stream = sys.stdin.buffer
+    sr, channels, frames = _read_header(stream)
+    frame_bytes = channels * 4
     if frames == 0:
-        raw = stream.read()
+        # Streaming: length unknown, read into a (writable) buffer that doubles when full
+        raw = bytearray(1 << 20)
+        size = 0
+        readinto = getattr(stream, 'readinto1', stream.readinto)
+        mv = memoryview(raw)
+        while True:
+            if size == len(raw):
+                mv.release()
+                raw.extend(bytes(len(raw)))
+                mv = memoryview(raw)
+            n = readinto(mv[size:])
+            if not n:
+                break
+            size += n
+        mv.release()
+        del raw[size:]
+        samples = np.frombuffer(raw, dtype='<f4', count=size // frame_bytes * channels)
+        samples = samples.reshape(-1, channels)
     else:
-        raw = stream.read(frames * channels * 4)
-    samples = np.frombuffer(raw, dtype='<f4').reshape(-1, channels)
-    return AudioData(samples.astype(np.float32), sr)
+        # Known length: read straight into the final sample buffer
+        samples = np.empty((frames, channels), dtype='<f4')
+        got = _readinto_full(stream, memoryview(samples.reshape(-1).view(np.uint8)))
+        samples = samples[:got // frame_bytes]
+    if sys.byteorder == 'big':
+        samples = samples.byteswap(inplace=True).view(np.float32)
+    return AudioData(samples, sr)
 
 
 def write_pipe(audio: AudioData, stream=None) -> None:
     """Write AudioData to a pipe stream (default: stdout binary)."""
     if stream is None:
         stream = sys.stdout.buffer
-    header = struct.pack(PIPE_HEADER_FMT, PIPE_MAGIC, audio.sample_rate, audio.channels, audio.frames)
-    stream.write(header)
-    stream.write(audio.samples.astype('<f4').tobytes())
+    _write_header(stream, audio.sample_rate, audio.channels, audio.frames)
+    _write_samples(audio.samples, stream)
     stream.flush()
 
 
+def _write_samples(arr: np.ndarray, stream) -> None:
+    if arr.dtype != np.dtype('<f4') or not arr.flags['C_CONTIGUOUS']:
+        # Strided view (e.g. reversed) or other dtype: convert a block of frames
+        # at a time instead of copying the whole signal
+        rows = max(1, _CONVERT_BLOCK_BYTES // max(arr[:1].size * 4, 1))
+        for t0 in range(0, len(arr), rows):
+            _write_samples(np.ascontiguousarray(arr[t0:t0 + rows], dtype='<f4'), stream)
+        return
+    # Write the ndarray buffer in pipe-sized slices — no intermediate bytes copy
+    mv = memoryview(arr.reshape(-1).view(np.uint8))
+    for off in range(0, len(mv), PIPE_CHUNK_SIZE):
+        stream.write(mv[off:off + PIPE_CHUNK_SIZE])
+
+
+@functools.lru_cache(maxsize=8)
+def _isatty_fd(fd: int) -> bool:
+    return os.isatty(fd)
+
+
 def is_pipe(stream) -> bool:
     """Return True if the stream is a pipe/non-interactive."""
-    return not stream.isatty()
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # No real fd (e.g. captured/in-memory streams)
+        return not stream.isatty()
+    return not _isatty_fd(fd)
 
 
 def load_input(path: str | None) -> AudioData:
@@ -149,3 +289,26 @@ def save_output(audio: AudioData, path: str | None, format: str | None = None) -
     if path is None:
         raise ValueError("No output: provide a file path or pipe audio via stdout")
     save(audio, path, format=format)
+
+
+def save_output_blocks(blocks, sample_rate: int, channels: int, frames: int,
+                       path: str | None, format: str | None = None) -> None:
+    """
+    Like save_output, but the samples arrive as an iterable of (n, channels)
+    float32 blocks totalling `frames`, so the whole signal is never in memory.
+    """
+    if path == '-' or (path is None and is_pipe(sys.stdout)):
+        stream = sys.stdout.buffer
+        _write_header(stream, sample_rate, channels, frames)
+        for block in blocks:
+            _write_samples(block, stream)
+        stream.flush()
+        return
+    if path is None:
+        raise ValueError("No output: provide a file path or pipe audio via stdout")
+    sf_format, subtype = _sf_format(Path(path), format)
+    import soundfile as sf
+    with sf.SoundFile(str(path), 'w', sample_rate, channels,
+                      subtype=subtype, format=sf_format) as f:
+        for block in blocks:
+            f.write(block)
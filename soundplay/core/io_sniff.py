@@ -0,0 +1,51 @@
+"""Format detection shared by the dual-domain (audio or .spx) CLI tools."""
+
+import io
+
+SPECTRAL_MAGIC = b'SPXF'
+
+# First 4 bytes of each stream/container we accept; anything else is left to
+# the audio decoders to accept or reject
+_MAGIC = {
+    SPECTRAL_MAGIC: 'spectral',
+    b'SPAW': 'audio',
+    b'RIFF': 'audio',
+    b'fLaC': 'audio',
+    b'OggS': 'audio',
+}
+_PEEK_BUFFER_SIZE = 65536
+
+
+def sniff_stream(stream) -> tuple[str, object]:
+    """
+    Peek at the first 4 bytes of a binary stream to determine format.
+    Returns (format, buffered_stream) where format is 'spectral' or 'audio'
+    and buffered_stream still starts at those 4 bytes. The body is never
+    copied: decoders read straight from the (peekable) stream.
+    """
+    if not hasattr(stream, 'peek'):
+        stream = io.BufferedReader(stream, buffer_size=_PEEK_BUFFER_SIZE)
+    header = stream.peek(4)[:4]
+    if len(header) < 4:
+        # Short first read on a slow pipe: peek can't wait for more, so take it all
+        data = stream.read()
+        header, stream = data[:4], io.BytesIO(data)
+    return format_from_magic(header), stream
+
+
+def format_from_magic(header: bytes) -> str:
+    """Return 'spectral' or 'audio' from a stream's first 4 bytes."""
+    return _MAGIC.get(bytes(header[:4]), 'audio')
+
+
+def detect_format(path: str | None) -> str | None:
+    """Return 'spectral', 'audio', or None (needs sniffing) from file extension."""
+    if path is not None and path != '-':
+        # Common case first: a real path. Suffix of the final path component,
+        # as Path.suffix, without building a Path
+        name = path[max(path.rfind('/'), path.rfind('\\')) + 1:]
+        dot = name.rfind('.')
+        if dot > 0 and name[dot:].lower() == '.spx':
+            return 'spectral'
+        return 'audio'
+    return None
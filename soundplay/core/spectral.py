@@ -24,19 +24,36 @@ Data layout:
     stored in C order (row-major)
 """
 
+import functools
+import io
 import json
+import mmap
+import os
 import struct
 import sys
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from scipy.signal import get_window
+from soundplay.core.audio import _readinto_full
 
 MAGIC = b'SPXF'
 HEADER_LEN_FMT = '<4sI'
 HEADER_LEN_SIZE = struct.calcsize(HEADER_LEN_FMT)  # 8 bytes
 FORMAT_VERSION = 1
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data: bytes):
+        return json.loads(data.decode('utf-8'))
+
 
 @dataclass
 class SpectralData:
@@ -64,6 +81,17 @@ class SpectralData:
     def duration(self) -> float:
         return self.original_frames / self.sample_rate
 
+    @property
+    def nyquist(self) -> float:
+        return self.sample_rate / 2.0
+
+    @functools.cached_property
+    def freq_bins(self) -> np.ndarray:
+        """Centre frequency (Hz) of each bin, computed once and shared read-only."""
+        freqs = np.linspace(0, self.nyquist, self.bins)
+        freqs.flags.writeable = False
+        return freqs
+
 
 def _header_dict(sd: SpectralData) -> dict:
     return {
@@ -79,39 +107,183 @@ def _header_dict(sd: SpectralData) -> dict:
     }
 
 
-def _stft_to_bytes(sd: SpectralData) -> bytes:
-    # Store as (channels, frames, bins, 2) float32
-    ri = np.stack([sd.stft.real, sd.stft.imag], axis=-1).astype('<f4')
-    return ri.tobytes()
+def _stft_to_bytes(sd: SpectralData) -> memoryview:
+    # complex64 is already interleaved [real, imag] float32 in memory, so the
+    # (channels, frames, bins) buffer *is* the (channels, frames, bins, 2) layout
+    arr = np.ascontiguousarray(sd.stft, dtype='<c8')
+    return memoryview(arr.reshape(-1).view(np.uint8))
+
+
+def _bytes_to_stft(data, channels: int, frames: int, bins: int) -> np.ndarray:
+    ri = np.frombuffer(data, dtype='<f4', count=channels * frames * bins * 2)
+    if sys.byteorder == 'big':
+        # Swap to native order in place rather than through an astype copy
+        if not ri.flags.writeable:
+            ri = ri.copy()
+        ri = ri.byteswap(inplace=True).view(np.float32)
+    return ri.reshape(channels, frames, bins * 2).view(np.complex64)
+
+
+def _mirrors_file(stft: np.memmap) -> bool:
+    """
+    True if no page of stft's mapping has been written since it was mapped. A
+    copy-on-write mapping keeps written pages private (anonymous), which Linux
+    reports in /proc/self/pagemap; elsewhere a writable mapping counts as modified.
+    """
+    if stft.mode == 'r':
+        return True
+    if not sys.platform.startswith('linux'):
+        return False
+    base = np.frombuffer(stft._mmap, dtype=np.uint8)
+    page = mmap.PAGESIZE
+    first = base.ctypes.data // page
+    count = (base.ctypes.data + base.nbytes - 1) // page - first + 1
+    try:
+        with open('/proc/self/pagemap', 'rb') as f:
+            f.seek(first * 8)
+            entries = np.frombuffer(f.read(count * 8), dtype=np.uint64)
+    except OSError:
+        return False
+    if len(entries) != count:
+        return False
+    # bit 63: present, bit 62: swapped, bit 61: file-backed
+    present = (entries >> np.uint64(63)) & np.uint64(1)
+    swapped = (entries >> np.uint64(62)) & np.uint64(1)
+    file_page = (entries >> np.uint64(61)) & np.uint64(1)
+    return not np.any(swapped | (present & ~file_page & np.uint64(1)))
+
+
+def _memmap_extent(stft: np.ndarray) -> tuple[str, int] | None:
+    """
+    (filename, byte offset) of stft's bytes in its backing file, if stft is a
+    C-contiguous np.memmap view already in on-disk layout whose pages still
+    match the file; otherwise None.
+    """
+    if not isinstance(stft, np.memmap) or stft.filename is None or stft._mmap is None:
+        return None
+    if stft.dtype != np.dtype('<c8') or not stft.flags['C_CONTIGUOUS']:
+        return None
+    if not _mirrors_file(stft):
+        return None
+    # np.memmap maps from offset rounded down to the allocation granularity
+    map_start = stft.offset - stft.offset % mmap.ALLOCATIONGRANULARITY
+    map_base = np.frombuffer(stft._mmap, dtype=np.uint8).ctypes.data
+    return stft.filename, map_start + (stft.ctypes.data - map_base)
+
+
+def _advise(stft: np.ndarray, advice: str) -> None:
+    """
+    madvise the mapping behind a memory-mapped STFT (e.g. 'MADV_SEQUENTIAL',
+    'MADV_DONTNEED'). A no-op for in-memory arrays or where unsupported.
+    """
+    flag = getattr(mmap, advice, None)
+    base = getattr(stft, '_mmap', None) if isinstance(stft, np.memmap) else None
+    if flag is None or base is None or not hasattr(base, 'madvise'):
+        return
+    # Dropping written copy-on-write pages would revert them to the file's bytes
+    if advice == 'MADV_DONTNEED' and not _mirrors_file(stft):
+        return
+    base.madvise(flag)
+
+
+def _sendfile_body(sd: SpectralData, stream) -> bool:
+    """Copy a memory-mapped STFT body kernel-to-kernel into stream. Returns False if not possible."""
+    if not sys.platform.startswith('linux'):
+        return False
+    extent = _memmap_extent(sd.stft)
+    if extent is None:
+        return False
+    try:
+        out_fd = stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+    filename, offset = extent
+    remaining = sd.stft.nbytes
+    stream.flush()  # header bytes must reach the fd before the body
+    with open(filename, 'rb') as src:
+        while remaining > 0:
+            try:
+                sent = os.sendfile(out_fd, src.fileno(), offset, remaining)
+            except OSError:
+                # e.g. EINVAL for an O_APPEND output: nothing of the body has gone
+                # out yet on the first call, so the buffered write can take over
+                if remaining == sd.stft.nbytes:
+                    return False
+                raise
+            if sent == 0:
+                raise ValueError(f"Unexpected end of {filename} while copying .spx body")
+            offset += sent
+            remaining -= sent
+    return True
+
+
+def _write_header(sd: SpectralData, stream, **overrides) -> None:
+    """Write sd's header; overrides replace header fields (e.g. frames for a body written in parts)."""
+    header_json = _dumps(_header_dict(sd) | overrides)
+    stream.write(struct.pack(HEADER_LEN_FMT, MAGIC, len(header_json)))
+    stream.write(header_json)
 
 
-def _bytes_to_stft(data: bytes, channels: int, frames: int, bins: int) -> np.ndarray:
-    ri = np.frombuffer(data, dtype='<f4').reshape(channels, frames, bins, 2)
-    return (ri[..., 0] + 1j * ri[..., 1]).astype(np.complex64)
+def _write_body(sd: SpectralData, stream) -> None:
+    if _sendfile_body(sd, stream):
+        return
+    stft = sd.stft
+    if stft.dtype == np.dtype('<c8') and stft.flags['C_CONTIGUOUS']:
+        stream.write(_stft_to_bytes(sd))
+        return
+    # Strided views (e.g. reversed or frame-sliced multichannel STFTs): make one
+    # ~2 MiB block contiguous at a time instead of copying the whole body
+    block = max(1, _OP_BLOCK_BYTES // max(stft.shape[2] * 8, 1))
+    for ch in range(stft.shape[0]):
+        for t0 in range(0, stft.shape[1], block):
+            part = np.ascontiguousarray(stft[ch, t0:t0 + block], dtype='<c8')
+            stream.write(memoryview(part.reshape(-1).view(np.uint8)))
+
+
+def _same_file(a: str | Path, b: str | Path) -> bool:
+    """True if a and b are the same file on disk (through symlinks or hardlinks too)."""
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        # b does not exist yet, so it cannot be the file mapped at a
+        return False
+
+
+def _detach_from(sd: SpectralData, path: str | Path) -> SpectralData:
+    """sd, with its STFT copied into memory if it is mapped from path (about to be truncated)."""
+    stft = sd.stft
+    if isinstance(stft, np.memmap) and stft.filename is not None \
+            and _same_file(stft.filename, path):
+        return SpectralData(np.array(stft), sd.sample_rate, sd.n_fft,
+                            sd.hop_length, sd.window, sd.original_frames)
+    return sd
 
 
 def save(sd: SpectralData, path: str | Path) -> None:
-    header_json = json.dumps(_header_dict(sd)).encode('utf-8')
-    body = _stft_to_bytes(sd)
+    sd = _detach_from(sd, path)
     with open(path, 'wb') as f:
-        f.write(struct.pack(HEADER_LEN_FMT, MAGIC, len(header_json)))
-        f.write(header_json)
-        f.write(body)
+        _write_header(sd, f)
+        _write_body(sd, f)
 
 
-def load(path: str | Path) -> SpectralData:
-    with open(path, 'rb') as f:
-        return _read_stream(f)
+def load(path: str | Path, copy: bool = False) -> SpectralData:
+    """
+    Load a .spx file. The STFT body is memory-mapped copy-on-write: pages are
+    shared with the OS cache and fault in on first access, and in-place edits
+    stay private to this process, never reaching the file. Pass copy=True to
+    read it fully into memory instead, detached from the file.
+    """
+    if copy or sys.byteorder == 'big':
+        with open(path, 'rb') as f:
+            return _read_stream(f)
+    return _read_file(path)
 
 
 def write_pipe(sd: SpectralData, stream=None) -> None:
     if stream is None:
         stream = sys.stdout.buffer
-    header_json = json.dumps(_header_dict(sd)).encode('utf-8')
-    body = _stft_to_bytes(sd)
-    stream.write(struct.pack(HEADER_LEN_FMT, MAGIC, len(header_json)))
-    stream.write(header_json)
-    stream.write(body)
+    _write_header(sd, stream)
+    _write_body(sd, stream)
     stream.flush()
 
 
@@ -121,18 +293,24 @@ def read_pipe(stream=None) -> SpectralData:
     return _read_stream(stream)
 
 
-def _read_stream(stream) -> SpectralData:
+def _read_header(stream) -> dict:
     prefix = stream.read(HEADER_LEN_SIZE)
     if len(prefix) < HEADER_LEN_SIZE:
         raise ValueError("Truncated .spx stream: missing header prefix")
     magic, hlen = struct.unpack(HEADER_LEN_FMT, prefix)
     if magic != MAGIC:
         raise ValueError(f"Not a .spx file (magic={magic!r})")
-    header = json.loads(stream.read(hlen).decode('utf-8'))
+    header = _loads(stream.read(hlen))
     if header['version'] != FORMAT_VERSION:
         raise ValueError(f"Unsupported .spx version: {header['version']}")
-    body = stream.read()
-    stft = _bytes_to_stft(body, header['channels'], header['frames'], header['bins'])
+    if header['bins'] != header['n_fft'] // 2 + 1:
+        # Everything downstream indexes the one-sided (rfft) layout
+        raise ValueError(f"Invalid .spx header: {header['bins']} bins for n_fft={header['n_fft']} "
+                         f"(expected {header['n_fft'] // 2 + 1})")
+    return header
+
+
+def _from_header(header: dict, stft: np.ndarray) -> SpectralData:
     return SpectralData(
         stft=stft,
         sample_rate=header['sample_rate'],
@@ -143,10 +321,120 @@ def _read_stream(stream) -> SpectralData:
     )
 
 
+def _read_stream(stream) -> SpectralData:
+    return _read_body(stream, _read_header(stream))
+
+
+def _read_body(stream, header: dict) -> SpectralData:
+    # Read into a bytearray so the reinterpreted STFT view is writable
+    body = bytearray(header['channels'] * header['frames'] * header['bins'] * 8)
+    if _readinto_full(stream, memoryview(body)) < len(body):
+        raise ValueError("Truncated .spx stream: body shorter than header describes")
+    stft = _bytes_to_stft(body, header['channels'], header['frames'], header['bins'])
+    return _from_header(header, stft)
+
+
+def _read_file(path: str | Path) -> SpectralData:
+    with open(path, 'rb') as f:
+        header = _read_header(f)
+        offset = f.tell()
+        shape = (header['channels'], header['frames'], header['bins'])
+        nbytes = shape[0] * shape[1] * shape[2] * 8
+        if nbytes == 0:
+            return _read_body(f, header)
+        if os.fstat(f.fileno()).st_size - offset < nbytes:
+            raise ValueError("Truncated .spx stream: body shorter than header describes")
+    stft = np.memmap(path, dtype='<c8', mode='c', offset=offset, shape=shape)
+    return _from_header(header, stft)
+
+
 # ---------------------------------------------------------------------------
 # STFT / iSTFT using scipy (no librosa dependency)
 # ---------------------------------------------------------------------------
 
+_STFT_BLOCK_FRAMES = 256  # frames per batched ShortTimeFFT call
+_OP_BLOCK_BYTES = 2 << 20  # STFT bytes per block for frame-wise operators (~L2 sized)
+_FFT_FRAMES_PER_WORKER = 2048  # below this many frames an extra FFT thread costs more than it saves
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_window(window: str, n_fft: int) -> np.ndarray:
+    """Window coefficients as a read-only float32 array, memoized per (window, n_fft)."""
+    from scipy.signal import get_window
+
+    win = get_window(window, n_fft).astype(np.float32)
+    win.setflags(write=False)
+    return win
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_sft(window: str, n_fft: int, hop_length: int, sample_rate: int):
+    """
+    ShortTimeFFT plan matching scipy.signal.stft's phase convention, or None on
+    scipy < 1.12.
+    """
+    try:
+        from scipy.signal import ShortTimeFFT
+    except ImportError:
+        return None
+    return ShortTimeFFT(_cached_window(window, n_fft), hop_length, fs=sample_rate,
+                        mfft=n_fft, scale_to='magnitude', phase_shift=None)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _channel_pool() -> ThreadPoolExecutor:
+    """The shared channel pool, created on first use (exactly once across threads)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _pool
+
+
+def _map_channels(fn, channels: int) -> None:
+    """Run fn(ch) for every channel, in parallel when there is more than one.
+
+    scipy's pocketfft releases the GIL, so threads give real speed-up here.
+    The calls run side by side, so each fn(ch) must write only its own,
+    disjoint slice of any shared output.
+    """
+    if channels == 1:
+        fn(0)
+        return
+    list(_channel_pool().map(fn, range(channels)))
+
+
+def _fft_workers(frames: int, channels: int) -> int:
+    """
+    pocketfft threads for each channel's transform: the cores the channel pool
+    leaves idle, but only as many as the input is long enough to keep busy.
+    """
+    spare = (os.cpu_count() or 1) // max(channels, 1)
+    return max(1, min(spare, frames // _FFT_FRAMES_PER_WORKER))
+
+
+def _map_frame_blocks(fn, stft: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Call fn(src, dst) over matching ~2 MiB frame blocks of stft and out, so
+    per-element operators only ever need block-sized temporaries. Returns out.
+
+    Blocks are (1, frames, bins) slices of a single channel, and channels run
+    in parallel via _map_channels — numpy ufuncs release the GIL on large arrays.
+    """
+    frame_bytes = stft.shape[2] * stft.itemsize
+    block = max(1, _OP_BLOCK_BYTES // max(frame_bytes, 1))
+
+    def _one(ch):
+        for t0 in range(0, stft.shape[1], block):
+            fn(stft[ch:ch + 1, t0:t0 + block], out[ch:ch + 1, t0:t0 + block])
+
+    _map_channels(_one, stft.shape[0])
+    return out
+
+
 def compute_stft(samples: np.ndarray, sample_rate: int,
                  n_fft: int = 2048, hop_length: int = 512,
                  window: str = 'hann') -> SpectralData:
@@ -163,22 +451,38 @@ def compute_stft(samples: np.ndarray, sample_rate: int,
 
     channels = samples.shape[1]
     original_frames = samples.shape[0]
-    win = get_window(window, n_fft)
-
-    stft_channels = []
-    for ch in range(channels):
-        _, _, Zxx = scipy_stft(
-            samples[:, ch],
-            fs=sample_rate,
-            window=win,
-            nperseg=n_fft,
-            noverlap=n_fft - hop_length,
-            boundary='zeros',
-            padded=True,
-        )
-        stft_channels.append(Zxx.T)  # transpose to (time_frames, bins)
-
-    stft = np.stack(stft_channels, axis=0).astype(np.complex64)  # (ch, frames, bins)
+
+    # Frame count of scipy's stft with boundary='zeros', padded=True
+    padded_len = original_frames + 2 * (n_fft // 2)
+    padded_len += (-(padded_len - n_fft) % hop_length) % n_fft
+    time_frames = (padded_len - n_fft) // hop_length + 1
+    stft = np.empty((channels, time_frames, n_fft // 2 + 1), dtype=np.complex64)
+
+    SFT = _cached_sft(window, n_fft, hop_length, sample_rate)
+    if SFT is not None:
+        # One plan, batched over all channels. Transform a block of frames at a
+        # time so the complex128 scratch stays small instead of output-sized.
+        x = samples.T
+        for p0 in range(0, time_frames, _STFT_BLOCK_FRAMES):
+            p1 = min(p0 + _STFT_BLOCK_FRAMES, time_frames)
+            Zxx = SFT.stft(x, p0=p0, p1=p1)  # (ch, bins, block_frames)
+            stft[:, p0:p1] = np.swapaxes(Zxx, 1, 2)
+    else:
+        win = _cached_window(window, n_fft)
+
+        def _one(ch):
+            _, _, Zxx = scipy_stft(
+                samples[:, ch],
+                fs=sample_rate,
+                window=win,
+                nperseg=n_fft,
+                noverlap=n_fft - hop_length,
+                boundary='zeros',
+                padded=True,
+            )
+            stft[ch] = Zxx.T  # transpose to (time_frames, bins)
+
+        _map_channels(_one, channels)
     return SpectralData(
         stft=stft,
         sample_rate=sample_rate,
@@ -189,26 +493,36 @@ def compute_stft(samples: np.ndarray, sample_rate: int,
     )
 
 
-def compute_istft(sd: SpectralData) -> np.ndarray:
+def compute_istft(sd: SpectralData, clip: bool = True) -> np.ndarray:
     """
-    Inverse STFT. Returns float32 array shape (frames, channels).
+    Inverse STFT. Returns float32 array shape (frames, channels), clipped to
+    [-1, 1] unless clip=False (for callers that rescale before clipping).
     """
+    from scipy.fft import set_workers
     from scipy.signal import istft as scipy_istft
 
-    win = get_window(sd.window, sd.n_fft)
-    channels = []
-    for ch in range(sd.channels):
-        _, x = scipy_istft(
-            sd.stft[ch].T,  # scipy expects (bins, time_frames)
-            fs=sd.sample_rate,
-            window=win,
-            nperseg=sd.n_fft,
-            noverlap=sd.n_fft - sd.hop_length,
-            boundary=True,
-        )
-        channels.append(x)
-
-    out = np.stack(channels, axis=1).astype(np.float32)  # (frames, channels)
-    # Trim to original length
-    out = out[:sd.original_frames]
-    return np.clip(out, -1.0, 1.0)
+    if sd.bins != sd.n_fft // 2 + 1:
+        raise ValueError(f"Expected a one-sided STFT with {sd.n_fft // 2 + 1} bins "
+                         f"for n_fft={sd.n_fft}, got {sd.bins}")
+    win = _cached_window(sd.window, sd.n_fft)
+    # Output length of scipy's istft with boundary=True, trimmed to original length
+    istft_len = (sd.frames - 1) * sd.hop_length + sd.n_fft - 2 * (sd.n_fft // 2)
+    out = np.empty((min(istft_len, sd.original_frames), sd.channels), dtype=np.float32)
+    workers = _fft_workers(sd.frames, sd.channels)
+
+    def _one(ch):
+        with set_workers(workers):  # thread-local, so set inside each channel job
+            _, x = scipy_istft(
+                sd.stft[ch].T,  # scipy expects (bins, time_frames)
+                fs=sd.sample_rate,
+                window=win,
+                nperseg=sd.n_fft,
+                noverlap=sd.n_fft - sd.hop_length,
+                boundary=True,
+            )
+        out[:, ch] = x[:out.shape[0]]
+
+    _map_channels(_one, sd.channels)
+    if clip:
+        np.clip(out, -1.0, 1.0, out=out)
+    return out
@@ -1,8 +1,28 @@
 """Shared time-value parsing: accepts raw seconds or a percentage string (e.g. '10%')."""
 
+from typing import NamedTuple
+
 import click
 
 
+class TimeValue(NamedTuple):
+    """A parsed time value: kind is 'sec' (absolute seconds) or 'pct' (percent of total)."""
+    kind: str
+    value: float
+
+
+def parse(value) -> TimeValue:
+    """Parse seconds (1.5) or a percentage string ('10%') into a TimeValue. Raises ValueError."""
+    if isinstance(value, TimeValue):
+        return value
+    if isinstance(value, (int, float)):
+        return TimeValue('sec', float(value))
+    s = str(value).strip()
+    if s.endswith('%'):
+        return TimeValue('pct', float(s[:-1]))
+    return TimeValue('sec', float(s))
+
+
 class TimeParam(click.ParamType):
     """Click parameter type that accepts either a float (seconds) or 'X%' (percent of total)."""
     name = 'TIME'
@@ -10,19 +30,12 @@ class TimeParam(click.ParamType):
     def convert(self, value, param, ctx):
         if value is None:
             return None
-        if isinstance(value, float):
-            return str(value)
-        s = str(value).strip()
-        if s.endswith('%'):
-            try:
-                float(s[:-1])
-                return s
-            except ValueError:
-                self.fail(f"{s!r} is not a valid percentage", param, ctx)
         try:
-            float(s)
-            return s
+            return parse(value)
         except ValueError:
+            s = str(value).strip()
+            if s.endswith('%'):
+                self.fail(f"{s!r} is not a valid percentage", param, ctx)
             self.fail(f"{s!r} is not a valid time value — use seconds (1.5) or percent (10%)",
                       param, ctx)
 
@@ -30,11 +43,12 @@ class TimeParam(click.ParamType):
 TIME = TimeParam()
 
 
-def resolve(value: str | None, total: float) -> float | None:
-    """Convert a stored TimeParam string to an absolute number of seconds."""
+def resolve(value: TimeValue | str | None, total: float) -> float | None:
+    """Convert a TimeParam value (or a raw seconds/percent string) to absolute seconds."""
     if value is None:
         return None
-    s = str(value).strip()
-    if s.endswith('%'):
-        return float(s[:-1]) / 100.0 * total
-    return float(s)
+    if not isinstance(value, TimeValue):
+        value = parse(value)
+    if value.kind == 'pct':
+        return value.value / 100.0 * total
+    return value.value
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from soundplay.core.audio import AudioData
 
 _player = None
@@ -12,12 +14,15 @@ class Player:
         import sounddevice as sd
         self._sd = sd
         self._stream = None
+        self._buf = None
 
     def play(self, audio: AudioData, start: float = 0.0) -> None:
         self.stop()
         start_frame = int(round(start * audio.sample_rate))
-        samples = audio.samples[start_frame:]
-        self._sd.play(samples, samplerate=audio.sample_rate)
+        # sounddevice reads asynchronously from a C-contiguous float32 buffer;
+        # make it once up front and keep it alive for the duration of playback
+        self._buf = np.ascontiguousarray(audio.samples[start_frame:], dtype=np.float32)
+        self._sd.play(self._buf, samplerate=audio.sample_rate)
 
     def stop(self) -> None:
         self._sd.stop()
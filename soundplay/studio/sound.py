@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+
 import numpy as np
 from pathlib import Path
 
@@ -16,6 +19,13 @@ from soundplay.core.spectral import (
 )
 
 
+@functools.cache
+def _tools(module: str, *names: str) -> tuple:
+    """Import soundplay.tools.<module> lazily and cache the requested helpers."""
+    mod = importlib.import_module(f'soundplay.tools.{module}')
+    return tuple(getattr(mod, n) for n in names)
+
+
 class Sound:
     __slots__ = ('_audio', '_spectral', '_name')
 
@@ -28,6 +38,15 @@ class Sound:
         self._spectral = spectral
         self._name = name
 
+    @classmethod
+    def _from_spectral_trusted(cls, spectral: SpectralData, name: str | None) -> Sound:
+        """Internal constructor for callers that already hold a valid SpectralData."""
+        s = cls.__new__(cls)
+        s._audio = None
+        s._spectral = spectral
+        s._name = name
+        return s
+
     # -- Lazy conversion properties ------------------------------------------
 
     @property
@@ -74,38 +93,39 @@ class Sound:
     # -- Dual-domain transforms -----------------------------------------------
 
     def gain(self, factor: float) -> Sound:
-        from soundplay.tools.gain import _gain_audio, _gain_spectral
+        _gain_audio, _gain_spectral = _tools('gain', '_gain_audio', '_gain_spectral')
         if self._spectral is not None:
             return Sound(spectral=_gain_spectral(self.spectral, factor), name=self._name)
         return Sound(audio=_gain_audio(self.audio, factor), name=self._name)
 
     def normalize(self, target_db: float = 0.0, mode: str = 'peak') -> Sound:
-        from soundplay.tools.normalize import _normalize_audio, _normalize_spectral
+        (_normalize_audio, _normalize_spectral) = _tools(
+            'normalize', '_normalize_audio', '_normalize_spectral')
         if self._spectral is not None:
             return Sound(spectral=_normalize_spectral(self.spectral, target_db, mode), name=self._name)
         return Sound(audio=_normalize_audio(self.audio, target_db, mode), name=self._name)
 
     def fade(self, fade_in: float = 0.0, fade_out: float = 0.0) -> Sound:
-        from soundplay.tools.fade import _fade_audio, _fade_spectral
+        _fade_audio, _fade_spectral = _tools('fade', '_fade_audio', '_fade_spectral')
         if self._spectral is not None:
             return Sound(spectral=_fade_spectral(self.spectral, fade_in, fade_out), name=self._name)
         return Sound(audio=_fade_audio(self.audio, fade_in, fade_out), name=self._name)
 
     def reverse(self) -> Sound:
-        from soundplay.tools.reverse import _reverse_audio, _reverse_spectral
+        _reverse_audio, _reverse_spectral = _tools('reverse', '_reverse_audio', '_reverse_spectral')
         if self._spectral is not None:
             return Sound(spectral=_reverse_spectral(self.spectral), name=self._name)
         return Sound(audio=_reverse_audio(self.audio), name=self._name)
 
     def trim(self, start: float = 0.0, end: float | None = None) -> Sound:
-        from soundplay.tools.trim import _trim_audio, _trim_spectral
+        _trim_audio, _trim_spectral = _tools('trim', '_trim_audio', '_trim_spectral')
         end = end if end is not None else self.duration
         if self._spectral is not None:
             return Sound(spectral=_trim_spectral(self.spectral, start, end), name=self._name)
         return Sound(audio=_trim_audio(self.audio, start, end), name=self._name)
 
     def loop(self, times: int = 2) -> Sound:
-        from soundplay.tools.loop import _loop_audio, _loop_spectral
+        _loop_audio, _loop_spectral = _tools('loop', '_loop_audio', '_loop_spectral')
         if self._spectral is not None:
             return Sound(spectral=_loop_spectral(self.spectral, times), name=self._name)
         return Sound(audio=_loop_audio(self.audio, times), name=self._name)
@@ -114,17 +134,16 @@ class Sound:
         audio = self.audio
         sr = audio.sample_rate
         ch = audio.channels
-        parts = []
-        if start > 0:
-            parts.append(np.zeros((int(round(start * sr)), ch), dtype=np.float32))
-        parts.append(audio.samples)
-        if end > 0:
-            parts.append(np.zeros((int(round(end * sr)), ch), dtype=np.float32))
-        return Sound(audio=AudioData(np.concatenate(parts, axis=0), sr), name=self._name)
+        ns = int(round(start * sr)) if start > 0 else 0
+        ne = int(round(end * sr)) if end > 0 else 0
+        # One zeroed allocation; only the original samples need copying in
+        out = np.zeros((ns + audio.frames + ne, ch), dtype=np.float32)
+        out[ns:ns + audio.frames] = audio.samples
+        return Sound(audio=AudioData(out, sr), name=self._name)
 
     def filter(self, type: str, freq: float, freq_hi: float | None = None,
                order: int = 4) -> Sound:
-        from soundplay.tools.filter import _apply_filter, _filter_spectral
+        _apply_filter, _filter_spectral = _tools('filter', '_apply_filter', '_filter_spectral')
         if self._spectral is not None:
             return Sound(spectral=_filter_spectral(self.spectral, type, freq, freq_hi), name=self._name)
         filtered = _apply_filter(self.audio.samples, self.audio.sample_rate,
@@ -134,25 +153,25 @@ class Sound:
     # -- Spectral-only transforms ---------------------------------------------
 
     def transpose(self, semitones: float) -> Sound:
-        from soundplay.tools.transpose import _transpose
+        _transpose = _tools('transpose', '_transpose')[0]
         return Sound(spectral=_transpose(self.spectral, semitones), name=self._name)
 
     def gate(self, threshold_db: float = -40.0) -> Sound:
-        from soundplay.tools.gate import _gate
+        _gate = _tools('gate', '_gate')[0]
         return Sound(spectral=_gate(self.spectral, threshold_db), name=self._name)
 
     def denoise(self, noise_start: float = 0.0, noise_end: float = 0.5,
                 oversubtract: float = 1.0) -> Sound:
-        from soundplay.tools.denoise import _denoise
+        _denoise = _tools('denoise', '_denoise')[0]
         return Sound(spectral=_denoise(self.spectral, noise_start, noise_end, oversubtract), name=self._name)
 
     def stretch(self, factor: float) -> Sound:
-        from soundplay.tools.stretch import _stretch
+        _stretch = _tools('stretch', '_stretch')[0]
         return Sound(spectral=_stretch(self.spectral, factor), name=self._name)
 
     def morph(self, other: Sound, blend_start: float = 0.0,
               blend_end: float = 1.0) -> Sound:
-        from soundplay.tools.morph import _morph
+        _morph = _tools('morph', '_morph')[0]
         return Sound(spectral=_morph(self.spectral, other.spectral, blend_start, blend_end), name=self._name)
 
     # -- Analysis -------------------------------------------------------------
@@ -160,32 +179,25 @@ class Sound:
     def decompose(self, max_notes: int = 12, min_freq: float = 50.0,
                   prominence: float = 15.0, bin_window: int = 2,
                   max_harmonics: int = 16) -> list[Sound]:
-        from soundplay.tools.decompose import (
-            _mean_magnitude, _find_fundamentals, _harmonic_bins, _apply_mask,
-        )
+        (_mean_magnitude, _find_fundamentals, _bin_owners, _apply_mask) = _tools(
+            'decompose', '_mean_magnitude', '_find_fundamentals', '_bin_owners', '_apply_mask')
         sd = self.spectral
-        nyquist = sd.sample_rate / 2.0
-        freq_bins = np.linspace(0, nyquist, sd.bins)
+        freq_bins = sd.freq_bins
         mean_mag = _mean_magnitude(sd)
         fundamentals = _find_fundamentals(mean_mag, freq_bins, min_freq, max_notes, prominence)
-        parts = []
-        claimed = np.zeros(sd.bins, dtype=bool)
-        for hz, _ in fundamentals:
-            mask = _harmonic_bins(hz, freq_bins, bin_window, max_harmonics)
-            mask = mask & ~claimed
-            claimed |= mask
-            component = _apply_mask(sd, mask)
-            parts.append(Sound(spectral=component, name=f"{hz:.1f}Hz"))
-        return parts
+        owner = _bin_owners([hz for hz, _ in fundamentals], freq_bins, bin_window, max_harmonics)
+        return [Sound._from_spectral_trusted(_apply_mask(sd, owner == i), f"{hz:.1f}Hz")
+                for i, (hz, _) in enumerate(fundamentals)]
 
     def pitch_track(self, fmin: float = 50.0, fmax: float = 2000.0) -> list[tuple]:
-        from soundplay.tools.pitch_track import _pitch_track
+        _pitch_track = _tools('pitch_track', '_pitch_track')[0]
         return _pitch_track(self.spectral, fmin, fmax)
 
     def rms(self, window: float = 0.1, hop: float | None = None) -> list[tuple]:
-        from soundplay.tools.rms import _rms_track
+        _rms_track = _tools('rms', '_rms_track')[0]
         hop_s = hop if hop is not None else window
-        return _rms_track(self.audio, window, hop_s)
+        # _rms_track returns a (windows, 3) array; keep the list-of-tuples API
+        return list(map(tuple, _rms_track(self.audio, window, hop_s).tolist()))
 
     # -- I/O ------------------------------------------------------------------
 
@@ -254,7 +266,7 @@ def save(sound: Sound, path: str, format: str | None = None) -> None:
 
 
 def concat(*sounds: Sound) -> Sound:
-    from soundplay.tools.concat import _concat_audio
+    _concat_audio = _tools('concat', '_concat_audio')[0]
     audios = [s.audio for s in sounds]
     return Sound(audio=_concat_audio(audios), name='concat')
 
@@ -280,8 +292,12 @@ def mix(*sounds: Sound, weights: list[float] | None = None) -> Sound:
 
     max_frames = max(a.frames for a in aligned)
     acc = np.zeros((max_frames, max_ch), dtype=np.float32)
+    tmp = np.empty_like(acc)  # one scratch buffer for every weighted input
     for a, weight in zip(aligned, w):
-        acc[:a.frames, :] += a.samples * weight
+        n = a.frames
+        np.multiply(a.samples, np.float32(weight), out=tmp[:n])
+        np.add(acc[:n], tmp[:n], out=acc[:n])
 
-    result = AudioData(np.clip(acc, -1.0, 1.0).astype(np.float32), sr)
+    np.clip(acc, -1.0, 1.0, out=acc)  # acc is already float32; clip in place
+    result = AudioData(acc, sr)
     return Sound(audio=result, name='mix')
@@ -24,7 +24,14 @@ def show_spectrogram(sound, channel: int = -1, db_range: float = 80.0,
                      fmin: float = 20.0, fmax: float | None = None,
                      colormap: str = 'inferno', notes: bool = False,
                      note_labels: bool = False, all_notes: bool = False,
-                     title: str | None = None, figsize: tuple = (12, 6)):
+                     title: str | None = None, figsize: tuple = (12, 6),
+                     reducer: str = 'mean_abs'):
+    """
+    reducer picks how channels combine when channel == -1: 'mean_abs' averages
+    magnitudes, 'rms' takes the root of the mean power across channels.
+    """
+    if reducer not in ('mean_abs', 'rms'):
+        raise ValueError(f"Unknown reducer {reducer!r} (expected 'mean_abs' or 'rms')")
     _ensure_interactive_backend()
     import matplotlib.pyplot as plt
     import matplotlib.ticker as ticker
@@ -32,18 +39,39 @@ def show_spectrogram(sound, channel: int = -1, db_range: float = 80.0,
 
     sd = sound.spectral
 
-    if channel == -1:
-        mag_ch = np.abs(sd.stft).mean(axis=0)
+    if channel == -1 and sd.channels > 1:
+        # Accumulate one contiguous (frames, bins) channel at a time instead of
+        # materialising |stft| for every channel and reducing across them
+        rms = reducer == 'rms'
+        mag_ch = np.abs(sd.stft[0])
+        tmp = np.empty_like(mag_ch)
+        if rms:
+            np.square(mag_ch, out=mag_ch)
+        for ch in range(1, sd.channels):
+            np.abs(sd.stft[ch], out=tmp)
+            if rms:
+                np.square(tmp, out=tmp)
+            mag_ch += tmp
+        mag_ch /= sd.channels
+        if rms:
+            np.sqrt(mag_ch, out=mag_ch)
     else:
-        mag_ch = np.abs(sd.stft[channel])
-
-    db = 20.0 * np.log10(np.maximum(mag_ch, 1e-10))
+        # -1 on a mono file is just its only channel; other indices (negative
+        # ones counting from the end) select as before
+        mag_ch = np.abs(sd.stft[0 if channel == -1 else channel])
+
+    # mag_ch is a fresh array: floor, log and clip it in place rather than
+    # allocating a new frames x bins buffer for every step
+    db = mag_ch
+    np.maximum(db, 1e-10, out=db)
+    np.log10(db, out=db)
+    db *= 20.0
     db_max = db.max()
     db_min = db_max - db_range
-    db = np.clip(db, db_min, db_max)
+    np.clip(db, db_min, db_max, out=db)
 
-    nyquist = sd.sample_rate / 2.0
-    freq_bins = np.linspace(0, nyquist, sd.bins)
+    nyquist = sd.nyquist
+    freq_bins = sd.freq_bins
     time_axis = np.arange(sd.frames) * sd.hop_length / sd.sample_rate
 
     f_max = min(fmax, nyquist) if fmax is not None else nyquist
@@ -71,16 +99,20 @@ def show_spectrogram(sound, channel: int = -1, db_range: float = 80.0,
 
     if notes or note_labels or all_notes:
         guide_notes = note_guidelines(fmin, f_max)
-        for hz, name, is_c in guide_notes:
-            if not all_notes and not is_c:
-                ax.axhline(hz, color='white', linewidth=0.3, alpha=0.25, linestyle='--')
-                continue
-            lw = 0.8 if is_c else 0.4
-            alpha = 0.6 if is_c else 0.4
-            ax.axhline(hz, color='white', linewidth=lw, alpha=alpha, linestyle='--')
-            if note_labels or all_notes:
-                ax.text(time_axis[-1], hz, f' {name}', color='white', fontsize=6,
-                        va='center', ha='left', clip_on=True)
+        c_hz = [hz for hz, _, is_c in guide_notes if is_c]
+        other_hz = [hz for hz, _, is_c in guide_notes if not is_c]
+        # One LineCollection per style, spanning the axes width like axhline
+        span = ax.get_yaxis_transform()
+        lw, alpha = (0.4, 0.4) if all_notes else (0.3, 0.25)
+        ax.hlines(other_hz, 0, 1, transform=span, colors='white',
+                  linewidth=lw, alpha=alpha, linestyle='--')
+        ax.hlines(c_hz, 0, 1, transform=span, colors='white',
+                  linewidth=0.8, alpha=0.6, linestyle='--')
+        if note_labels or all_notes:
+            for hz, name, is_c in guide_notes:
+                if is_c or all_notes:
+                    ax.text(time_axis[-1], hz, f' {name}', color='white', fontsize=6,
+                            va='center', ha='left', clip_on=True)
 
     fig.tight_layout()
     plt.show()
@@ -107,7 +139,16 @@ def show_waveform(sound, channel: int = -1, title: str | None = None,
         ch_label = 'ch 0'
 
     fig, ax = plt.subplots(figsize=figsize)
-    ax.plot(time_axis, data, linewidth=0.4)
+    # Far more samples than pixels: draw a per-column min/max envelope instead
+    columns = int(figsize[0] * 100)
+    if len(data) > 2 * columns:
+        per = -(-len(data) // columns)
+        n = -(-len(data) // per)
+        blocks = np.pad(data, (0, n * per - len(data)), mode='edge').reshape(n, per)
+        t = np.arange(n) * per / sr
+        ax.fill_between(t, blocks.min(axis=1), blocks.max(axis=1), linewidth=0)
+    else:
+        ax.plot(time_axis, data, linewidth=0.4)
     ax.set_xlabel('Time (s)')
     ax.set_ylabel('Amplitude')
     ax.set_title(title or f'{repr(sound)} [{ch_label}]')
@@ -2,14 +2,13 @@
 
 import numpy as np
 import click
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, is_pipe
 from soundplay.core import spectral as sp
+from soundplay.core.io_sniff import detect_format
 
-
-def _detect_format(path: str) -> str:
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+_LOAD_WORKERS = 8
 
 
 def _concat_audio(parts: list[AudioData]) -> AudioData:
@@ -31,7 +30,12 @@ def _concat_audio(parts: list[AudioData]) -> AudioData:
         else:
             aligned.append(p)
 
-    return AudioData(np.concatenate([p.samples for p in aligned], axis=0), sr)
+    out = np.empty((sum(p.frames for p in aligned), max_ch), dtype=np.float32)
+    off = 0
+    for p in aligned:
+        out[off:off + p.frames] = p.samples
+        off += p.frames
+    return AudioData(out, sr)
 
 
 def _concat_spectral(parts: list[sp.SpectralData]) -> sp.SpectralData:
@@ -46,7 +50,13 @@ def _concat_spectral(parts: list[sp.SpectralData]) -> sp.SpectralData:
         if p.channels != ref.channels:
             raise click.UsageError(f"Channel count mismatch in file {i+1}")
 
-    stft = np.concatenate([p.stft for p in parts], axis=1)  # concat along frames
+    # Concat along frames, copying each part straight into its slice. Loaded parts
+    # are memory-mapped, so only the output has to be resident.
+    stft = np.empty((ref.channels, sum(p.frames for p in parts), ref.bins), dtype=np.complex64)
+    off = 0
+    for p in parts:
+        stft[:, off:off + p.frames] = p.stft
+        off += p.frames
     orig = sum(p.original_frames for p in parts)
     return sp.SpectralData(
         stft=stft,
@@ -78,13 +88,15 @@ def main(inputs, output, fmt):
     if len(inputs) < 2:
         raise click.UsageError("Need at least 2 input files")
 
-    fmt_in = _detect_format(inputs[0])
+    fmt_in = detect_format(inputs[0]) or 'audio'
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
-        parts = [sp.load(f) for f in inputs]
+        parts = [sp.load(f) for f in inputs]  # memory-mapped: nothing to overlap
     else:
-        parts = [load(f) for f in inputs]
+        # Decoding releases the GIL, so reads of several files can overlap
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(inputs))) as pool:
+            parts = list(pool.map(load, inputs))
 
     # ------------------------------------------------------------------ concat
     if fmt_in == 'spectral':
@@ -97,7 +109,7 @@ def main(inputs, output, fmt):
         p = Path(inputs[0])
         output = str(p.with_stem(p.stem + '_concat'))
 
-    fmt_out = _detect_format(output)
+    fmt_out = detect_format(output) or 'audio'
 
     # ------------------------------------------------------------------ save
     if fmt_out == 'spectral':
@@ -4,14 +4,25 @@ import sys
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.spectral import load, read_pipe, save, SpectralData
+from soundplay.core.spectral import load, read_pipe, SpectralData, _write_header
 from soundplay.core.audio import is_pipe
 
 
+_BLOCK_FRAMES = 512
+
+
 def _mean_magnitude(sd: SpectralData) -> np.ndarray:
     """Average magnitude spectrum across time frames (and channels). Shape: (bins,)"""
-    # stft shape: (channels, frames, bins)
-    return np.abs(sd.stft).mean(axis=(0, 1))  # → (bins,)
+    # stft shape: (channels, frames, bins). Reduce in frame blocks so |STFT| is
+    # never materialised for the whole file at once.
+    acc = np.zeros(sd.bins, dtype=np.float64)
+    scratch = np.empty((sd.channels, min(_BLOCK_FRAMES, sd.frames), sd.bins),
+                       dtype=np.float32)
+    for t0 in range(0, sd.frames, _BLOCK_FRAMES):
+        block = sd.stft[:, t0:t0 + _BLOCK_FRAMES]
+        mag = np.abs(block, out=scratch[:, :block.shape[1]])
+        acc += mag.sum(axis=(0, 1), dtype=np.float64)
+    return (acc / (sd.channels * sd.frames)).astype(np.float32)  # → (bins,)
 
 
 def _find_fundamentals(mean_mag: np.ndarray, freq_bins: np.ndarray,
@@ -23,73 +34,67 @@ def _find_fundamentals(mean_mag: np.ndarray, freq_bins: np.ndarray,
     """
     from scipy.signal import find_peaks
 
-    db = 20.0 * np.log10(np.maximum(mean_mag, 1e-10))
+    # One buffer for floor, log and scale; mean_mag itself is left untouched
+    db = np.maximum(mean_mag, 1e-10)
+    np.log10(db, out=db)
+    db *= 20.0
 
-    # Suppress bins below min_freq
-    db_search = db.copy()
-    db_search[freq_bins < min_freq] = -np.inf
-
-    peaks, props = find_peaks(db_search, prominence=prominence_db)
-    if len(peaks) == 0:
-        return []
+    # Suppress bins below min_freq (db is ours, so no copy is needed)
+    db[:np.searchsorted(freq_bins, min_freq)] = -np.inf
 
     # Feed ALL prominence-passing peaks into the sieve — do NOT pre-limit by
     # max_notes here.  The sieve collapses harmonics into fundamentals, so the
     # pre-sieve pool is much larger than the final output.  Limiting early
     # caused high-ranked harmonics to crowd out weaker-but-genuine fundamentals.
-    order = np.argsort(-props['prominences'])
-    candidates = sorted((freq_bins[peaks[i]], int(peaks[i])) for i in order)
+    peaks, _ = find_peaks(db, prominence=prominence_db)
+    if len(peaks) == 0:
+        return []
+    hz = freq_bins[peaks]  # peaks are in ascending bin order, so sorted by frequency
 
     # Sieve: remove any peak that is close to an integer harmonic of a
     # lower-frequency peak already accepted as a fundamental.
     # Tolerance of 5% (~84 cents) handles slight intonation and bin-quantisation.
-    fundamentals = []
-    for hz, idx in candidates:
-        is_harmonic = any(
-            abs(hz / f - round(hz / f)) / round(hz / f) < 0.05
-            for f, _ in fundamentals
-            if round(hz / f) >= 2
-        )
-        if not is_harmonic:
-            fundamentals.append((hz, idx))
+    # near[i, j]: peak i lies within tolerance of a harmonic (>= 2) of lower peak j.
+    ratios = hz[:, np.newaxis] / hz[np.newaxis, :]
+    n = np.rint(ratios)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        near = (n >= 2) & (np.abs(ratios - n) / n < 0.05)
+    keep = np.zeros(len(peaks), dtype=bool)
+    for i in range(len(peaks)):
+        keep[i] = not (near[i] & keep).any()
 
     # Apply max_notes limit to the post-sieve fundamentals
-    fundamentals = sorted(fundamentals[:max_notes])
+    fundamentals = [(freq_bins[i], int(i)) for i in peaks[keep][:max_notes]]
     return fundamentals
 
 
-def _harmonic_bins(fundamental_hz: float, freq_bins: np.ndarray,
-                   bin_window: int, max_harmonics: int) -> np.ndarray:
+def _bin_owners(fundamentals_hz, freq_bins: np.ndarray,
+                bin_window: int, max_harmonics: int) -> np.ndarray:
     """
-    Boolean mask: True for bins within bin_window of each harmonic of fundamental_hz.
+    Component index owning each bin: the first of fundamentals_hz with a harmonic
+    within bin_window bins of it, or -1 if none. Shape: (bins,)
+
+    Earlier fundamentals take precedence, so the per-component masks
+    (owner == i) never overlap and (owner < 0) is the remainder.
     """
-    mask = np.zeros(len(freq_bins), dtype=bool)
-    for n in range(1, max_harmonics + 1):
-        target = n * fundamental_hz
-        if target > freq_bins[-1]:
-            break
-        nearest = int(np.argmin(np.abs(freq_bins - target)))
-        lo = max(0, nearest - bin_window)
-        hi = min(len(freq_bins) - 1, nearest + bin_window)
-        mask[lo:hi + 1] = True
-    return mask
-
-
-def _fundamental_only_bins(fundamental_hz: float, freq_bins: np.ndarray,
-                            bin_window: int) -> np.ndarray:
-    """Boolean mask: True only for bins within bin_window of the fundamental."""
-    mask = np.zeros(len(freq_bins), dtype=bool)
-    nearest = int(np.argmin(np.abs(freq_bins - fundamental_hz)))
-    lo = max(0, nearest - bin_window)
-    hi = min(len(freq_bins) - 1, nearest + bin_window)
-    mask[lo:hi + 1] = True
-    return mask
+    n = len(freq_bins)
+    hz = np.asarray(fundamentals_hz, dtype=np.float64)
+    targets = hz[:, np.newaxis] * np.arange(1, max_harmonics + 1)  # (notes, harmonics)
+    keep = targets <= freq_bins[-1]
+    note = np.broadcast_to(np.arange(len(hz))[:, np.newaxis], targets.shape)[keep]
+    # freq_bins is linspace(0, nyquist, bins): the nearest bin is closed-form
+    df = freq_bins[-1] / (n - 1)
+    centers = np.clip(np.rint(targets[keep] / df).astype(np.intp), 0, n - 1)
+    idx = np.clip(centers[:, np.newaxis] + np.arange(-bin_window, bin_window + 1), 0, n - 1)
+    owner = np.full(n, len(hz), dtype=np.intp)
+    np.minimum.at(owner, idx.ravel(), np.repeat(note, idx.shape[1]))
+    owner[owner == len(hz)] = -1
+    return owner
 
 
 def _apply_mask(sd: SpectralData, bin_mask: np.ndarray) -> SpectralData:
     """Zero out all bins not in bin_mask, return new SpectralData."""
-    masked = sd.stft.copy()
-    masked[:, :, ~bin_mask] = 0.0
+    masked = np.multiply(sd.stft, bin_mask.astype(np.float32))
     return SpectralData(
         stft=masked,
         sample_rate=sd.sample_rate,
@@ -100,6 +105,23 @@ def _apply_mask(sd: SpectralData, bin_mask: np.ndarray) -> SpectralData:
     )
 
 
+def _save_masked(sd: SpectralData, bin_mask: np.ndarray, path: Path) -> None:
+    """
+    Write sd to path as .spx with all bins not in bin_mask zeroed. The body is
+    masked and written one frame block at a time, in file order, so the
+    component never exists in memory as a whole.
+    """
+    gain = bin_mask.astype(np.float32)
+    block = np.empty((min(_BLOCK_FRAMES, sd.frames), sd.bins), dtype='<c8')
+    with open(path, 'wb') as f:
+        _write_header(sd, f)
+        for ch in range(sd.channels):
+            for t0 in range(0, sd.frames, _BLOCK_FRAMES):
+                out = block[:min(_BLOCK_FRAMES, sd.frames - t0)]
+                np.multiply(sd.stft[ch, t0:t0 + len(out)], gain, out=out)
+                f.write(memoryview(out.reshape(-1).view(np.uint8)))
+
+
 @click.command()
 @click.argument('input', default=None, required=False)
 @click.option('--output-dir', default=None,
@@ -156,8 +178,7 @@ def main(input, output_dir, no_harmonics, max_notes, min_freq,
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Frequency axis
-    nyquist = sd.sample_rate / 2.0
-    freq_bins = np.linspace(0, nyquist, sd.bins)
+    freq_bins = sd.freq_bins
 
     # Detect fundamentals
     mean_mag = _mean_magnitude(sd)
@@ -173,36 +194,29 @@ def main(input, output_dir, no_harmonics, max_notes, min_freq,
     click.echo(f"Detected {len(fundamentals)} component(s):", err=True)
 
     results = []
-    claimed = np.zeros(sd.bins, dtype=bool)  # bins assigned to any component so far
-
-    for hz, bin_idx in fundamentals:
-        if no_harmonics:
-            mask = _fundamental_only_bins(hz, freq_bins, bin_window)
-            label = 'fundamental only'
-        else:
-            mask = _harmonic_bins(hz, freq_bins, bin_window, max_harmonics)
-            label = f'+ harmonics (window ±{bin_window} bins)'
-
-        # Strip bins already owned by an earlier component so masks never overlap.
-        mask = mask & ~claimed
-        claimed |= mask
+    # Bins go to the first (lowest) fundamental that claims them, so masks never overlap
+    owner = _bin_owners([hz for hz, _ in fundamentals], freq_bins, bin_window,
+                        1 if no_harmonics else max_harmonics)
+    label = 'fundamental only' if no_harmonics else f'+ harmonics (window ±{bin_window} bins)'
 
-        component = _apply_mask(sd, mask)
+    for i, (hz, bin_idx) in enumerate(fundamentals):
+        mask = owner == i
         out_name = f"{stem}_{hz:.1f}hz.spx"
         out_path = out_dir / out_name
-        save(component, out_path)
+        _save_masked(sd, mask, out_path)
 
-        energy = float(np.abs(component.stft).mean())
+        # Mean |STFT| of the masked component, from the per-bin means already computed
+        energy = float(mean_mag[mask].sum() / sd.bins)
         click.echo(f"  {hz:8.2f} Hz  →  {out_path}  [{label}, mean energy {energy:.4f}]",
                    err=True)
         results.append(out_path)
 
     if not no_remainder:
-        remainder = _apply_mask(sd, ~claimed)
         rem_path = out_dir / f"{stem}_remainder.spx"
-        save(remainder, rem_path)
-        rem_energy = float(np.abs(remainder.stft).mean())
-        uncovered_pct = (~claimed).sum() / sd.bins * 100
+        unclaimed = owner < 0
+        _save_masked(sd, unclaimed, rem_path)
+        rem_energy = float(mean_mag[unclaimed].sum() / sd.bins)
+        uncovered_pct = unclaimed.sum() / sd.bins * 100
         click.echo(
             f"  remainder  →  {rem_path}  "
             f"[{uncovered_pct:.1f}% of bins, mean energy {rem_energy:.4f}]",
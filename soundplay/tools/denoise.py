@@ -4,7 +4,9 @@ import sys
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.spectral import SpectralData, load, read_pipe, save, write_pipe
+from soundplay.core.spectral import (
+    SpectralData, load, read_pipe, save, write_pipe, _map_frame_blocks,
+)
 from soundplay.core.audio import is_pipe
 from soundplay.core.timeutil import TIME, resolve as resolve_time
 
@@ -19,16 +21,26 @@ def _denoise(sd: SpectralData, noise_start_s: float, noise_end_s: float,
     frame_start = max(0, min(frame_start, sd.frames - 1))
     frame_end = max(frame_start + 1, min(frame_end, sd.frames))
 
-    # Noise profile: mean magnitude over noise region, averaged across channels
-    noise_region = np.abs(sd.stft[:, frame_start:frame_end, :])  # (ch, frames, bins)
-    noise_profile = noise_region.mean(axis=(0, 1))  # (bins,)
-
-    # Spectral subtraction per channel
-    magnitudes = np.abs(sd.stft)  # (ch, frames, bins)
-    phases = np.angle(sd.stft)
-
-    new_mag = np.maximum(magnitudes - oversubtract * noise_profile[np.newaxis, np.newaxis, :], 0.0)
-    new_stft = (new_mag * np.exp(1j * phases)).astype(np.complex64)
+    # Noise profile: mean magnitude over noise region, averaged across channels.
+    # Accumulated one channel at a time into a (bins,) sum — never |x| of the whole region
+    noise_region = sd.stft[:, frame_start:frame_end, :]  # (ch, frames, bins)
+    noise_profile = np.zeros(sd.bins, dtype=np.float32)
+    for ch_region in noise_region:
+        noise_profile += np.abs(ch_region).sum(axis=0)
+    noise_profile /= np.float32(noise_region.shape[0] * noise_region.shape[1])  # (bins,)
+
+    # Spectral subtraction per channel, applied as a real gain new_mag / mag on
+    # the complex STFT so the phase is kept without an angle/exp round trip
+    floor = np.float32(oversubtract) * noise_profile[np.newaxis, np.newaxis, :]
+
+    def _subtract(block, out):
+        magnitudes = np.abs(block)  # (ch, block frames, bins)
+        gain = magnitudes - floor
+        np.maximum(gain, 0.0, out=gain)
+        np.divide(gain, magnitudes, out=gain, where=gain > 0.0)  # gain > 0 implies mag > 0
+        np.multiply(block, gain, out=out)
+
+    new_stft = _map_frame_blocks(_subtract, sd.stft, np.empty(sd.stft.shape, dtype=np.complex64))
 
     return SpectralData(
         stft=new_stft,
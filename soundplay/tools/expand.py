@@ -1,29 +1,13 @@
 """sp-expand: Pad an audio or spectral file with silence."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, read_pipe, write_pipe, is_pipe
 from soundplay.core import spectral as sp
 from soundplay.core.timeutil import TIME, resolve as resolve_time
-
-_SPECTRAL_MAGIC = b'SPXF'
-
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
 
 def _pad_audio(audio: AudioData, pad_start_s: float, pad_end_s: float) -> AudioData:
@@ -31,9 +15,9 @@ def _pad_audio(audio: AudioData, pad_start_s: float, pad_end_s: float) -> AudioD
     ch = audio.channels
     start_frames = int(round(pad_start_s * sr))
     end_frames   = int(round(pad_end_s   * sr))
-    silence_start = np.zeros((start_frames, ch), dtype=np.float32)
-    silence_end   = np.zeros((end_frames,   ch), dtype=np.float32)
-    padded = np.concatenate([silence_start, audio.samples, silence_end], axis=0)
+    # One zeroed allocation; only the original samples need copying in
+    padded = np.zeros((start_frames + audio.frames + end_frames, ch), dtype=np.float32)
+    padded[start_frames:start_frames + audio.frames] = audio.samples
     return AudioData(padded, sr)
 
 
@@ -41,9 +25,8 @@ def _pad_spectral(sd: sp.SpectralData, pad_start_s: float, pad_end_s: float) ->
     frames_start = int(round(pad_start_s * sd.sample_rate / sd.hop_length))
     frames_end   = int(round(pad_end_s   * sd.sample_rate / sd.hop_length))
     ch, _, bins = sd.stft.shape
-    silence_start = np.zeros((ch, frames_start, bins), dtype=np.complex64)
-    silence_end   = np.zeros((ch, frames_end,   bins), dtype=np.complex64)
-    padded_stft = np.concatenate([silence_start, sd.stft, silence_end], axis=1)
+    padded_stft = np.zeros((ch, frames_start + sd.frames + frames_end, bins), dtype=np.complex64)
+    padded_stft[:, frames_start:frames_start + sd.frames] = sd.stft
     orig_start = int(round(pad_start_s * sd.sample_rate))
     orig_end   = int(round(pad_end_s   * sd.sample_rate))
     return sp.SpectralData(
@@ -87,13 +70,13 @@ def main(input, output, pad_start, pad_end, pad, fmt):
       cat song.spx | sp-expand --pad-end 4 - out.spx
     """
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
 
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
@@ -1,38 +1,29 @@
 """sp-fade: Apply fade-in and/or fade-out to audio or spectral data."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
 from soundplay.core import spectral as sp
 from soundplay.core.timeutil import TIME, resolve as resolve_time
-
-_SPECTRAL_MAGIC = b'SPXF'
-
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
 
 def _make_envelope(total_frames: int, fade_in: int, fade_out: int) -> np.ndarray:
     """Build a gain envelope with linear fade-in and fade-out."""
     env = np.ones(total_frames, dtype=np.float32)
+    # Write each ramp straight into its slice of env, computed as linspace does
     if fade_in > 0:
-        env[:fade_in] = np.linspace(0.0, 1.0, fade_in, dtype=np.float32)
+        head = env[:fade_in]
+        np.multiply(np.arange(fade_in), 1.0 / max(fade_in - 1, 1), out=head)
+        if fade_in > 1:
+            head[-1] = 1.0
     if fade_out > 0:
-        env[-fade_out:] = np.linspace(1.0, 0.0, fade_out, dtype=np.float32)
+        tail = env[-fade_out:]
+        np.add(np.arange(fade_out) * (-1.0 / max(fade_out - 1, 1)), 1.0, out=tail)
+        if fade_out > 1:
+            tail[-1] = 0.0
     return env
 
 
@@ -40,18 +31,23 @@ def _fade_audio(audio: AudioData, fade_in_s: float, fade_out_s: float) -> AudioD
     fi = int(round(fade_in_s * audio.sample_rate))
     fo = int(round(fade_out_s * audio.sample_rate))
     env = _make_envelope(audio.frames, fi, fo)
-    # Broadcast across channels: env is (frames,), samples is (frames, channels)
-    return AudioData((audio.samples * env[:, np.newaxis]).astype(np.float32), audio.sample_rate)
+    # Broadcast across channels: env is (frames,), samples is (frames, channels).
+    # A single multiply pass straight into the float32 output, no cast copy.
+    out = np.multiply(audio.samples, env[:, np.newaxis], dtype=np.float32)
+    return AudioData(out, audio.sample_rate)
 
 
 def _fade_spectral(sd: sp.SpectralData, fade_in_s: float, fade_out_s: float) -> sp.SpectralData:
     fi = int(round(fade_in_s * sd.sample_rate / sd.hop_length))
     fo = int(round(fade_out_s * sd.sample_rate / sd.hop_length))
     env = _make_envelope(sd.frames, fi, fo)
-    # STFT shape is (channels, frames, bins) — broadcast env over frames axis
-    scaled = sd.stft * env[np.newaxis, :, np.newaxis]
+    # STFT shape is (channels, frames, bins) — broadcast env over frames axis.
+    # A broadcast multiply has no temporaries: one pass per channel, channels in parallel
+    scaled = np.empty(sd.stft.shape, dtype=np.complex64)
+    env = env[:, np.newaxis]
+    sp._map_channels(lambda ch: np.multiply(sd.stft[ch], env, out=scaled[ch]), sd.channels)
     return sp.SpectralData(
-        stft=scaled.astype(np.complex64),
+        stft=scaled,
         sample_rate=sd.sample_rate,
         n_fft=sd.n_fft,
         hop_length=sd.hop_length,
@@ -89,12 +85,12 @@ def main(input, output, fade_in, fade_out, fmt):
         raise click.UsageError("At least one of --fade-in or --fade-out is required")
 
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
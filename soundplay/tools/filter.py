@@ -1,71 +1,126 @@
 """sp-filter: Apply lowpass, highpass, bandpass, or notch filter."""
 
+import math
+import os
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
-from scipy.signal import butter, sosfilt
-from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
+from soundplay.core.audio import (
+    PIPE_MAGIC, AudioData, load, save_output, read_pipe, is_pipe,
+    _read_header, _readinto_full, _write_header,
+)
 from soundplay.core import spectral as sp
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
-_SPECTRAL_MAGIC = b'SPXF'
 
+_STREAM_BLOCK_FRAMES = 16384  # frames per sosfilt call when filtering pipe to pipe
 
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
 
+def _design_sos(sr: int, ftype: str, freq: float, freq_hi: float | None,
+                order: int) -> np.ndarray:
+    from scipy.signal import butter
 
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
-
-
-def _apply_filter(samples: np.ndarray, sr: int, ftype: str,
-                  freq: float, freq_hi: float | None, order: int) -> np.ndarray:
     nyq = sr / 2.0
     if ftype in ('bandpass', 'bandstop'):
         if freq_hi is None:
             raise click.UsageError(f"--freq-hi is required for {ftype} filter")
-        sos = butter(order, [freq / nyq, freq_hi / nyq], btype=ftype, output='sos')
-    else:
-        btype = 'low' if ftype == 'lowpass' else 'high'
-        sos = butter(order, freq / nyq, btype=btype, output='sos')
+        return butter(order, [freq / nyq, freq_hi / nyq], btype=ftype, output='sos')
+    btype = 'low' if ftype == 'lowpass' else 'high'
+    return butter(order, freq / nyq, btype=btype, output='sos')
+
+
+def _apply_filter(samples: np.ndarray, sr: int, ftype: str,
+                  freq: float, freq_hi: float | None, order: int) -> np.ndarray:
+    from scipy.signal import sosfilt
+
+    sos = _design_sos(sr, ftype, freq, freq_hi, order)
+    channels = samples.shape[1]
+    if channels > 1 and (os.cpu_count() or 1) > 1:
+        # Each channel is a serial recurrence but channels are independent, and
+        # sosfilt releases the GIL: run them side by side on the channel pool
+        out = np.empty(samples.shape, dtype=np.float32)
+
+        def _one(ch):
+            np.clip(sosfilt(sos, samples[:, ch]), -1.0, 1.0, out=out[:, ch])
+
+        sp._map_channels(_one, channels)
+        return out
+
+    # Filter each channel independently, all in one sosfilt call along time
+    out = sosfilt(sos, samples, axis=0)
+    np.clip(out, -1.0, 1.0, out=out)
+    return out.astype(np.float32, copy=False)
+
 
-    # Filter each channel independently
-    out = np.empty_like(samples)
-    for ch in range(samples.shape[1]):
-        out[:, ch] = sosfilt(sos, samples[:, ch])
-    return np.clip(out, -1.0, 1.0).astype(np.float32)
+def _filter_pipe(stream_in, stream_out, ftype: str, freq: float,
+                 freq_hi: float | None, order: int) -> None:
+    """
+    Filter an audio pipe stream block by block, carrying the sosfilt state
+    between blocks, so memory stays constant however long the input is.
+    Output matches _apply_filter on the whole signal.
+    """
+    from scipy.signal import sosfilt
+
+    sr, channels, frames = _read_header(stream_in)
+    sos = _design_sos(sr, ftype, freq, freq_hi, order)
+    _write_header(stream_out, sr, channels, frames)
+
+    zi = np.zeros((sos.shape[0], 2, channels))  # zero initial state, as in the one-shot path
+    buf = np.empty((_STREAM_BLOCK_FRAMES, channels), dtype='<f4')
+    out = np.empty_like(buf)
+    raw = memoryview(buf.reshape(-1).view(np.uint8))
+    frame_bytes = channels * 4
+    while True:
+        n = _readinto_full(stream_in, raw) // frame_bytes
+        if not n:
+            break
+        y, zi = sosfilt(sos, buf[:n], axis=0, zi=zi)
+        np.clip(y, -1.0, 1.0, out=out[:n])  # clip and downcast in one pass
+        stream_out.write(out[:n].reshape(-1).view(np.uint8))
+        if n < _STREAM_BLOCK_FRAMES:
+            break
+    stream_out.flush()
 
 
 def _filter_spectral(sd: sp.SpectralData, ftype: str,
                      freq: float, freq_hi: float | None) -> sp.SpectralData:
     """Apply filter in the frequency domain by zeroing out bins."""
-    freqs = np.fft.rfftfreq(sd.n_fft, 1.0 / sd.sample_rate)
+    bins = sd.bins
+
+    # Bin k sits at k * sr / n_fft Hz, so every filter type selects one contiguous
+    # bin range [lo, hi) whose edges follow from integer bin arithmetic
+    def _first_at_or_above(f):
+        return min(max(math.ceil(f * sd.n_fft / sd.sample_rate), 0), bins)
+
+    def _end_at_or_below(f):
+        return min(max(math.floor(f * sd.n_fft / sd.sample_rate) + 1, 0), bins)
 
+    band = True  # keep [lo, hi) and zero the rest; False = zero [lo, hi) only
     if ftype == 'lowpass':
-        mask = freqs <= freq
+        lo, hi = 0, _end_at_or_below(freq)
     elif ftype == 'highpass':
-        mask = freqs >= freq
+        lo, hi = _first_at_or_above(freq), bins
     elif ftype == 'bandpass':
         if freq_hi is None:
             raise click.UsageError("--freq-hi is required for bandpass filter")
-        mask = (freqs >= freq) & (freqs <= freq_hi)
+        lo = _first_at_or_above(freq)
+        hi = max(lo, _end_at_or_below(freq_hi))
     elif ftype == 'bandstop':
         if freq_hi is None:
             raise click.UsageError("--freq-hi is required for bandstop (notch) filter")
-        mask = (freqs < freq) | (freqs > freq_hi)
+        band = False
+        lo = _first_at_or_above(freq)
+        hi = max(lo, _end_at_or_below(freq_hi))
 
-    stft = sd.stft.copy()
-    stft[:, :, ~mask] = 0.0
+    if band:
+        stft = np.zeros(sd.stft.shape, dtype=np.complex64)
+        stft[:, :, lo:hi] = sd.stft[:, :, lo:hi]
+    else:
+        stft = np.array(sd.stft, dtype=np.complex64)
+        stft[:, :, lo:hi] = 0.0
     return sp.SpectralData(
-        stft=stft.astype(np.complex64),
+        stft=stft,
         sample_rate=sd.sample_rate,
         n_fft=sd.n_fft,
         hop_length=sd.hop_length,
@@ -74,6 +129,13 @@ def _filter_spectral(sd: sp.SpectralData, ftype: str,
     )
 
 
+def _describe(ftype: str, freq: float, freq_hi: float | None) -> str:
+    desc = f"{ftype} {freq:.0f}Hz"
+    if freq_hi is not None:
+        desc += f"–{freq_hi:.0f}Hz"
+    return desc
+
+
 @click.command()
 @click.argument('input', default=None, required=False)
 @click.argument('output', default=None, required=False)
@@ -107,13 +169,22 @@ def main(input, output, ftype, freq, freq_hi, order, fmt):
       sp-filter --type bandstop --freq 50 --freq-hi 60 recording.wav dehum.wav
       sp-filter --type lowpass --freq 1000 song.spx filtered.spx
     """
+    # ------------------------------------------------------------------ stream
+    # Audio pipe in, pipe out: filter block by block without buffering the input
+    stdin = sys.stdin.buffer
+    if (output == '-' and (input == '-' or (input is None and is_pipe(sys.stdin)))
+            and hasattr(stdin, 'peek') and stdin.peek(4)[:4] == PIPE_MAGIC):
+        _filter_pipe(stdin, sys.stdout.buffer, ftype, freq, freq_hi, order)
+        click.echo(f"Filtered ({_describe(ftype, freq, freq_hi)}) → -", err=True)
+        return
+
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
@@ -145,7 +216,4 @@ def main(input, output, ftype, freq, freq_hi, order, fmt):
             result = AudioData(samples, result.sample_rate)
         save_output(result, output, format=fmt)
 
-    desc = f"{ftype} {freq:.0f}Hz"
-    if freq_hi is not None:
-        desc += f"–{freq_hi:.0f}Hz"
-    click.echo(f"Filtered ({desc}) → {output}", err=True)
+    click.echo(f"Filtered ({_describe(ftype, freq, freq_hi)}) → {output}", err=True)
@@ -1,28 +1,12 @@
 """sp-gain: Scale volume by a factor or dB amount."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
 from soundplay.core import spectral as sp
-
-_SPECTRAL_MAGIC = b'SPXF'
-
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
 
 def _parse_gain(gain_str: str) -> float:
@@ -35,15 +19,15 @@ def _parse_gain(gain_str: str) -> float:
 
 
 def _gain_audio(audio: AudioData, factor: float) -> AudioData:
-    return AudioData(
-        np.clip(audio.samples * factor, -1.0, 1.0).astype(np.float32),
-        audio.sample_rate,
-    )
+    # Scale into a fresh float32 buffer, then clip that buffer in place
+    out = np.multiply(audio.samples, np.float32(factor), dtype=np.float32)
+    np.clip(out, -1.0, 1.0, out=out)
+    return AudioData(out, audio.sample_rate)
 
 
 def _gain_spectral(sd: sp.SpectralData, factor: float) -> sp.SpectralData:
     return sp.SpectralData(
-        stft=(sd.stft * factor).astype(np.complex64),
+        stft=np.multiply(sd.stft, np.float32(factor), dtype=np.complex64),  # no upcast, one pass
         sample_rate=sd.sample_rate,
         n_fft=sd.n_fft,
         hop_length=sd.hop_length,
@@ -80,12 +64,12 @@ def main(gain, input, output, fmt):
     factor = _parse_gain(gain)
 
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
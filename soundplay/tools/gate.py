@@ -4,14 +4,24 @@ import sys
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.spectral import SpectralData, load, read_pipe, save, write_pipe
+from soundplay.core.spectral import (
+    SpectralData, load, read_pipe, save, write_pipe, _map_frame_blocks,
+)
 from soundplay.core.audio import is_pipe
 
 
 def _gate(sd: SpectralData, threshold_db: float) -> SpectralData:
     linear = 10.0 ** (threshold_db / 20.0)
-    new_stft = sd.stft.copy()
-    new_stft[np.abs(new_stft) < linear] = 0.0
+    threshold2 = linear * linear
+
+    def _gate_block(block, out):
+        # Compare power against the squared threshold: no sqrt per bin
+        power = np.square(block.real)
+        power += np.square(block.imag)
+        np.copyto(out, block)
+        np.copyto(out, 0, where=power < threshold2)
+
+    new_stft = _map_frame_blocks(_gate_block, sd.stft, np.empty(sd.stft.shape, dtype=np.complex64))
     return SpectralData(
         stft=new_stft,
         sample_rate=sd.sample_rate,
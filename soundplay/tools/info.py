@@ -3,20 +3,9 @@
 import sys
 import io
 import click
-from pathlib import Path
+from soundplay.core.io_sniff import detect_format, format_from_magic
 
-_MAGIC_SPECTRAL = b'SPXF'
-_MAGIC_SPAW     = b'SPAW'
-_MAGIC_WAV      = b'RIFF'
-_MAGIC_FLAC     = b'fLaC'
-_MAGIC_OGG      = b'OggS'
-
-
-def _detect_format(path):
-    """Return 'spectral' or 'audio' from file extension, or None if unknown."""
-    if path is None or path == '-':
-        return None
-    return 'spectral' if Path(path).suffix.lower() == '.spx' else 'audio'
+_MAGIC_SPAW = b'SPAW'
 
 
 def _load_audio_from_buffer(buffered):
@@ -43,16 +32,14 @@ def main(input, as_json):
     INPUT may be a file path, '-' for stdin, or omitted when stdin is a pipe.
     Accepts raw WAV/FLAC files piped directly as well as SPAW/SPXF streams.
     """
-    fmt = _detect_format(input)
+    fmt = detect_format(input)
 
     if fmt is None:
-        # Sniff magic bytes from stdin to determine format
-        header = sys.stdin.buffer.read(4)
-        buffered = io.BytesIO(header + sys.stdin.buffer.read())
-        if header == _MAGIC_SPECTRAL:
-            fmt = 'spectral'
-        else:
-            fmt = 'audio'
+        # Sniff magic bytes from stdin to determine format. soundfile needs a
+        # seekable buffer; BytesIO shares the bytes read, so nothing is copied
+        data = sys.stdin.buffer.read()
+        fmt = format_from_magic(data[:4])
+        buffered = io.BytesIO(data)
     else:
         buffered = None
 
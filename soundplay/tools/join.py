@@ -4,7 +4,7 @@ import sys
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.spectral import load, read_pipe, save, write_pipe, SpectralData
+from soundplay.core.spectral import load, read_pipe, save, write_pipe, SpectralData, _advise
 from soundplay.core.audio import is_pipe
 
 
@@ -52,8 +52,18 @@ def _join(parts: list[SpectralData], strict: bool) -> SpectralData:
     ch, _, bins = ref.stft.shape
     acc = np.zeros((ch, max_frames, bins), dtype=np.complex64)
 
-    for p in parts:
-        acc[:, :p.frames, :] += p.stft
+    # The first part is copied rather than added to zeros; the rest are added
+    # in place through an explicit out= view, one pass per part. Loaded parts
+    # are memory-mapped: each is read sequentially, then its pages are dropped,
+    # so only the accumulator stays resident however many files are joined.
+    for i, p in enumerate(parts):
+        _advise(p.stft, 'MADV_SEQUENTIAL')
+        view = acc[:, :p.frames, :]
+        if i == 0:
+            np.copyto(view, p.stft)
+        else:
+            np.add(view, p.stft, out=view)
+        _advise(p.stft, 'MADV_DONTNEED')
 
     max_orig = max(p.original_frames for p in parts)
     return SpectralData(
@@ -89,6 +99,8 @@ def main(inputs, output, strict):
       sp-join parts/*.spx -o rejoined.spx
       sp-join a.spx b.spx c.spx -o - | sp-resynth - mix.wav
     """
+    # load() memory-maps each body, so this only reads headers; the STFT data
+    # is paged in one file at a time while joining
     parts = []
     for i, path in enumerate(inputs):
         sd = load(path)
@@ -1,28 +1,28 @@
 """sp-loop: Repeat an audio or spectral file N times."""
 
+import itertools
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
+from soundplay.core.audio import (
+    AudioData, load, save_output, save_output_blocks, read_pipe, is_pipe,
+)
 from soundplay.core import spectral as sp
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
-_SPECTRAL_MAGIC = b'SPXF'
 
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+def _write_looped_spectral(sd: sp.SpectralData, times: int, stream) -> None:
+    """Write sd looped `times` over as .spx, emitting the body without tiling it in memory."""
+    sp._write_header(sd, stream, frames=sd.frames * times,
+                     original_frames=sd.original_frames * times)
+    # Body is channel-major: each channel's frames, repeated, then the next channel
+    for ch in range(sd.channels):
+        body = sp._stft_to_bytes(sp.SpectralData(sd.stft[ch:ch + 1], sd.sample_rate, sd.n_fft,
+                                                 sd.hop_length, sd.window, sd.original_frames))
+        for _ in range(times):
+            stream.write(body)
+    stream.flush()
 
 
 def _loop_audio(audio: AudioData, times: int) -> AudioData:
@@ -68,12 +68,12 @@ def main(input, output, times, fmt):
         raise click.BadParameter("Must be at least 1", param_hint='--times')
 
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
@@ -83,30 +83,29 @@ def main(input, output, times, fmt):
         audio = read_pipe(buffered) if buffered else load(input)
         total = audio.duration
 
-    # ------------------------------------------------------------------ loop
-    if fmt_in == 'spectral':
-        result = _loop_spectral(sd, times)
-    else:
-        result = _loop_audio(audio, times)
-
     # ------------------------------------------------------------------ output path
     if output is None:
         p = Path(input)
         output = str(p.with_stem(f"{p.stem}_loop{times}"))
 
-    # ------------------------------------------------------------------ save
-    if fmt_out == 'spectral':
+    # ------------------------------------------------------------------ loop + save
+    # Repeats are streamed to the writer; only spectral → audio needs the tiled
+    # STFT, since resynthesis overlaps across the loop seams
+    if fmt_in == 'spectral' and fmt_out == 'spectral':
         if output == '-' or (output is None and is_pipe(sys.stdout)):
-            sp.write_pipe(result)
+            _write_looped_spectral(sd, times, sys.stdout.buffer)
         else:
-            sp.save(result, output)
+            sd = sp._detach_from(sd, output)
+            with open(output, 'wb') as f:
+                _write_looped_spectral(sd, times, f)
+    elif fmt_in == 'spectral':
+        looped = _loop_spectral(sd, times)
+        save_output(AudioData(sp.compute_istft(looped), looped.sample_rate), output, format=fmt)
     else:
-        if fmt_in == 'spectral':
-            samples = sp.compute_istft(result)
-            result = AudioData(samples, result.sample_rate)
-        save_output(result, output, format=fmt)
+        save_output_blocks(itertools.repeat(audio.samples, times), audio.sample_rate,
+                           audio.channels, audio.frames * times, output, format=fmt)
 
-    new_dur = result.duration if hasattr(result, 'duration') else (result.original_frames / result.sample_rate)
+    new_dur = total * times
     click.echo(
         f"Looped {times}× ({total:.3f}s → {new_dur:.3f}s) → {output}",
         err=True,
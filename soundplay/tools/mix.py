@@ -3,7 +3,7 @@
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.audio import AudioData, load, save_output, is_pipe
+from soundplay.core.audio import AudioData, load, probe, save_output, is_pipe
 
 
 @click.command()
@@ -40,33 +40,43 @@ def main(inputs, output, weights, fmt):
     else:
         w = [1.0 / len(inputs)] * len(inputs)
 
-    # ------------------------------------------------------------------ load
-    parts = [load(f) for f in inputs]
+    # ------------------------------------------------------------------ mix
+    # Sum the inputs one at a time so only the accumulator and a single decoded
+    # file are resident. Headers give the output shape up front; the accumulator
+    # only grows if an input had to be decoded to be measured.
+    shapes = [s for s in map(probe, inputs) if s is not None]
+    for s in shapes:
+        if s[2] != shapes[0][2]:
+            raise click.UsageError(f"Sample rate mismatch: {s[2]} vs {shapes[0][2]}")
+    acc = np.zeros((max((s[0] for s in shapes), default=0),
+                    max((s[1] for s in shapes), default=1)), dtype=np.float32)
 
-    sr = parts[0].sample_rate
-    for p in parts:
-        if p.sample_rate != sr:
+    sr = None
+    tmp = None  # weighted-part scratch, reused across inputs
+    for f, weight in zip(inputs, w):
+        p = load(f)
+        if sr is None:
+            sr = p.sample_rate
+        elif p.sample_rate != sr:
             raise click.UsageError(
                 f"Sample rate mismatch: {p.sample_rate} vs {sr}"
             )
+        if p.frames > acc.shape[0] or p.channels > acc.shape[1]:
+            grown = np.zeros((max(p.frames, acc.shape[0]), max(p.channels, acc.shape[1])),
+                             dtype=np.float32)
+            grown[:acc.shape[0], :] = acc  # a mono mix so far spreads to every channel
+            acc = grown
+        if tmp is None or tmp.shape != acc.shape:
+            tmp = np.empty(acc.shape, dtype=np.float32)
+        scaled = tmp[:p.frames, :p.channels]
+        np.multiply(p.samples, np.float32(weight), out=scaled)
+        # Fewer channels than the mix (e.g. mono into stereo) broadcast across it
+        view = acc[:p.frames, :]
+        np.add(view, scaled, out=view)
+        del p
 
-    # Match channels
-    max_ch = max(p.channels for p in parts)
-    aligned = []
-    for p in parts:
-        if p.channels < max_ch:
-            aligned.append(p.as_stereo() if max_ch == 2 else p)
-        else:
-            aligned.append(p)
-
-    # ------------------------------------------------------------------ mix
-    max_frames = max(p.frames for p in aligned)
-    acc = np.zeros((max_frames, max_ch), dtype=np.float32)
-
-    for p, weight in zip(aligned, w):
-        acc[:p.frames, :] += p.samples * weight
-
-    result = AudioData(np.clip(acc, -1.0, 1.0).astype(np.float32), sr)
+    np.clip(acc, -1.0, 1.0, out=acc)  # acc is already float32; clip in place
+    result = AudioData(acc, sr)
 
     # ------------------------------------------------------------------ output path
     if output is None:
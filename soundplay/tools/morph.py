@@ -4,8 +4,7 @@ import sys
 import numpy as np
 import click
 from pathlib import Path
-from scipy.interpolate import interp1d
-from soundplay.core.spectral import SpectralData, load, save, write_pipe
+from soundplay.core.spectral import SpectralData, load, save, write_pipe, _map_channels
 from soundplay.core.audio import is_pipe
 
 
@@ -14,29 +13,33 @@ def _morph(sd1: SpectralData, sd2: SpectralData,
     frames1 = sd1.frames
     frames2 = sd2.frames
 
-    # Resample sd2 to sd1's frame count
-    src_frames = np.linspace(0, 1, frames2)
-    dst_frames = np.linspace(0, 1, frames1)
-
-    # Interpolate sd2's real/imag along frames axis per channel
-    channels = sd1.channels
-    bins = sd1.bins
-    sd2_resampled = np.zeros((channels, frames1, bins), dtype=np.complex64)
-
-    for ch in range(channels):
-        real2 = sd2.stft[ch].real  # (frames2, bins)
-        imag2 = sd2.stft[ch].imag
-        interp_r = interp1d(src_frames, real2, axis=0, bounds_error=False,
-                            fill_value=(real2[0], real2[-1]))
-        interp_i = interp1d(src_frames, imag2, axis=0, bounds_error=False,
-                            fill_value=(imag2[0], imag2[-1]))
-        sd2_resampled[ch] = (interp_r(dst_frames) + 1j * interp_i(dst_frames)).astype(np.complex64)
-
-    # Build linear alpha envelope over frames
-    alpha = np.linspace(blend_start, blend_end, frames1)  # (frames,)
-    alpha = alpha[np.newaxis, :, np.newaxis]  # (1, frames, 1) for broadcasting
-
-    new_stft = ((1.0 - alpha) * sd1.stft + alpha * sd2_resampled).astype(np.complex64)
+    # Resample sd2 to sd1's frame count by linear interpolation along frames
+    # (gathering the two neighbouring source frames of every output frame) and
+    # blend with a linear alpha envelope, all folded into per-frame weights:
+    #   out = (1 - alpha) * sd1 + alpha * (1 - t) * sd2[lo] + alpha * t * sd2[hi]
+    idx = np.linspace(0, frames2 - 1, frames1)
+    lo = np.floor(idx).astype(np.intp)
+    hi = np.minimum(lo + 1, frames2 - 1)
+    t = (idx - lo).astype(np.float32)
+    alpha = np.linspace(blend_start, blend_end, frames1, dtype=np.float32)
+    w_lo = (alpha * (np.float32(1.0) - t))[:, np.newaxis]  # (frames, 1)
+    w_hi = (alpha * t)[:, np.newaxis]
+
+    # float32 weights keep everything in complex64; the output is the only
+    # full-size allocation, plus one (frames, bins) gather buffer per channel job.
+    w_sd1 = (np.float32(1.0) - alpha)[:, np.newaxis]
+    new_stft = np.empty(sd1.stft.shape, dtype=np.complex64)
+
+    def _one(ch):
+        out = new_stft[ch]
+        np.multiply(sd1.stft[ch], w_sd1, out=out)
+        buf = np.empty((frames1, sd1.bins), dtype=np.complex64)
+        for src, w in ((lo, w_lo), (hi, w_hi)):
+            np.take(sd2.stft[ch], src, axis=0, out=buf)
+            buf *= w
+            out += buf
+
+    _map_channels(_one, sd1.channels)
 
     return SpectralData(
         stft=new_stft,
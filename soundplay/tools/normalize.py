@@ -1,33 +1,23 @@
 """sp-normalize: Normalize audio to a target peak or RMS level."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
 from soundplay.core import spectral as sp
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
-_SPECTRAL_MAGIC = b'SPXF'
 
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
-
-
-def _normalize_audio(audio: AudioData, target_db: float, mode: str) -> AudioData:
+def _normalize_audio(audio: AudioData, target_db: float, mode: str,
+                     in_place: bool = False) -> AudioData:
+    """
+    in_place=True scales audio.samples itself (when writable) instead of a
+    copy — for callers that own the buffer and are done with the original.
+    """
     if mode == 'peak':
-        current = np.max(np.abs(audio.samples))
+        # Peak from the extremes: no full-size |x| temporary
+        current = max(float(audio.samples.max()), -float(audio.samples.min()))
     else:  # rms
         current = np.sqrt(np.mean(audio.samples ** 2))
 
@@ -35,20 +25,52 @@ def _normalize_audio(audio: AudioData, target_db: float, mode: str) -> AudioData
         return audio  # silence, nothing to normalize
 
     target_linear = 10.0 ** (target_db / 20.0)
-    factor = target_linear / current
-    return AudioData(
-        np.clip(audio.samples * factor, -1.0, 1.0).astype(np.float32),
-        audio.sample_rate,
-    )
+    factor = np.float32(target_linear / current)
+    out = audio.samples if in_place and audio.samples.flags.writeable else None
+    out = np.multiply(audio.samples, factor, out=out, dtype=np.float32)
+    np.clip(out, -1.0, 1.0, out=out)
+    return AudioData(out, audio.sample_rate)
 
 
-def _normalize_spectral(sd: sp.SpectralData, target_db: float, mode: str) -> sp.SpectralData:
-    # Resynth to measure level, compute factor, apply to STFT
-    samples = sp.compute_istft(sd)
-    if mode == 'peak':
-        current = np.max(np.abs(samples))
+def _spectral_rms(sd: sp.SpectralData) -> float:
+    """
+    Estimate of the resynthesised signal's RMS level, straight from the STFT
+    (no iSTFT). Only valid for an STFT computed directly from a signal: after
+    per-bin edits (stretch, transpose, morph, denoise, ...) the frames no
+    longer overlap-add consistently and the true level can be several dB lower.
+
+    By Parseval, each frame's full-spectrum power is n_fft * sum((x * w)^2) / sum(w)^2
+    under scipy's magnitude scaling, and overlapping frames cover every sample
+    with sum(w^2) / hop of window energy. Only the first and last half-window
+    are under-covered, so the estimate runs marginally low on very short inputs.
+    """
+    win = sp._cached_window(sd.window, sd.n_fft).astype(np.float64)
+    power = 0.0
+    for ch_stft in sd.stft:
+        mag2 = np.square(ch_stft.real)
+        mag2 += np.square(ch_stft.imag)
+        # One-sided spectrum: every bin but DC (and Nyquist, for even n_fft) appears twice
+        power += 2.0 * mag2.sum(dtype=np.float64) - mag2[:, 0].sum(dtype=np.float64)
+        if sd.n_fft % 2 == 0:
+            power -= mag2[:, -1].sum(dtype=np.float64)
+    energy = power * sd.hop_length * win.sum() ** 2 / (sd.n_fft * np.dot(win, win))
+    return float(np.sqrt(energy / (sd.original_frames * sd.channels)))
+
+
+def _normalize_spectral(sd: sp.SpectralData, target_db: float, mode: str,
+                        fast_rms: bool = False) -> sp.SpectralData:
+    """
+    Measure the level of the resynthesised signal, then scale the STFT to
+    target. fast_rms=True estimates RMS from the STFT instead (see _spectral_rms).
+    """
+    if mode == 'rms' and fast_rms:
+        current = _spectral_rms(sd)
     else:
-        current = np.sqrt(np.mean(samples ** 2))
+        samples = sp.compute_istft(sd, clip=False)  # the level the scaled STFT will have
+        if mode == 'peak':
+            current = max(float(samples.max()), -float(samples.min()))
+        else:
+            current = np.sqrt(np.mean(np.square(samples, dtype=np.float64)))
 
     if current < 1e-10:
         return sd
@@ -56,7 +78,7 @@ def _normalize_spectral(sd: sp.SpectralData, target_db: float, mode: str) -> sp.
     target_linear = 10.0 ** (target_db / 20.0)
     factor = target_linear / current
     return sp.SpectralData(
-        stft=(sd.stft * factor).astype(np.complex64),
+        stft=np.multiply(sd.stft, np.float32(factor), dtype=np.complex64),
         sample_rate=sd.sample_rate,
         n_fft=sd.n_fft,
         hop_length=sd.hop_length,
@@ -73,9 +95,12 @@ def _normalize_spectral(sd: sp.SpectralData, target_db: float, mode: str) -> sp.
 @click.option('--mode', '-m', default='peak', show_default=True,
               type=click.Choice(['peak', 'rms']),
               help='Normalize by peak or RMS level.')
+@click.option('--fast-rms', is_flag=True,
+              help='Spectral → spectral RMS mode: estimate the level from the STFT '
+                   'instead of resynthesising. Exact only for unmodified STFTs.')
 @click.option('--format', 'fmt', default=None,
               help='Force output format for audio (wav, flac).')
-def main(input, output, target, mode, fmt):
+def main(input, output, target, mode, fast_rms, fmt):
     """Normalize audio to a target peak or RMS level.
 
     \b
@@ -91,12 +116,12 @@ def main(input, output, target, mode, fmt):
       sp-normalize song.spx normalized.spx
     """
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
@@ -105,10 +130,15 @@ def main(input, output, target, mode, fmt):
         audio = read_pipe(buffered) if buffered else load(input)
 
     # ------------------------------------------------------------------ normalize
-    if fmt_in == 'spectral':
-        result = _normalize_spectral(sd, target, mode)
+    if fmt_in == 'spectral' and fmt_out == 'spectral':
+        result = _normalize_spectral(sd, target, mode, fast_rms=fast_rms)
     else:
-        result = _normalize_audio(audio, target, mode)
+        if fmt_in == 'spectral':
+            # Audio out: resynthesise once and normalize the samples, rather than
+            # resynthesising to measure and again to write. Unclipped, so hot
+            # peaks are scaled down rather than flattened; _normalize_audio clips
+            audio = AudioData(sp.compute_istft(sd, clip=False), sd.sample_rate)
+        result = _normalize_audio(audio, target, mode, in_place=True)  # freshly made, ours
 
     # ------------------------------------------------------------------ output path
     if output is None:
@@ -122,9 +152,6 @@ def main(input, output, target, mode, fmt):
         else:
             sp.save(result, output)
     else:
-        if fmt_in == 'spectral':
-            samples = sp.compute_istft(result)
-            result = AudioData(samples, result.sample_rate)
         save_output(result, output, format=fmt)
 
     click.echo(f"Normalized ({mode} → {target:+.1f} dBFS) → {output}", err=True)
@@ -5,7 +5,7 @@ import math
 import numpy as np
 import click
 from pathlib import Path
-from soundplay.core.spectral import SpectralData, load, read_pipe
+from soundplay.core.spectral import SpectralData, load, read_pipe, _OP_BLOCK_BYTES
 from soundplay.core.audio import is_pipe
 
 _NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
@@ -28,29 +28,41 @@ def _pitch_track(sd: SpectralData, fmin: float, fmax: float) -> list[tuple[float
     bin_min = max(0, int(math.ceil(fmin / freq_resolution)))
     bin_max = min(bins - 1, int(math.floor(fmax / freq_resolution)))
 
-    # Mean magnitude across channels
-    mag = np.abs(sd.stft).mean(axis=0)  # (frames, bins)
-
-    rows = []
-    for frame_idx in range(sd.frames):
-        time_s = frame_idx * hop / sr
-        frame_mag = mag[frame_idx, bin_min:bin_max + 1]
-        if frame_mag.max() == 0:
-            freq_hz = 0.0
-            midi = float('nan')
-            note = '—'
+    # Only the bins in [fmin, fmax] are ever looked at, and they are reduced in
+    # frame blocks so each block's magnitudes stay cache-resident
+    band = sd.stft[:, :, bin_min:bin_max + 1]
+    block = max(1, _OP_BLOCK_BYTES // max(band.shape[0] * band.shape[2] * band.itemsize, 1))
+    peak_offset = np.empty(sd.frames, dtype=np.intp)
+    silent = np.empty(sd.frames, dtype=bool)
+    for t0 in range(0, sd.frames, block):
+        # Magnitude summed across channels — the channel mean up to a constant factor,
+        # which moves neither the argmax nor the silence test. Mono ranks bins by
+        # power instead: same order, no sqrt per bin.
+        chunk = band[:, t0:t0 + block]
+        if sd.channels == 1:
+            mag = np.square(chunk[0].real)  # (block frames, band bins)
+            mag += np.square(chunk[0].imag)
         else:
-            peak_offset = int(np.argmax(frame_mag))
-            peak_bin = bin_min + peak_offset
-            freq_hz = peak_bin * freq_resolution
-            if freq_hz > 0:
-                midi = 69.0 + 12.0 * math.log2(freq_hz / 440.0)
-                note = _midi_to_note(midi)
-            else:
-                midi = float('nan')
-                note = '—'
-        rows.append((time_s, freq_hz, midi, note))
-    return rows
+            mag = np.abs(chunk[0])
+            for ch in range(1, sd.channels):
+                mag += np.abs(chunk[ch])
+        # Peak bin of every frame; frames with an all-zero band are silent
+        peaks = np.argmax(mag, axis=1)
+        peak_offset[t0:t0 + block] = peaks
+        silent[t0:t0 + block] = mag[np.arange(len(peaks)), peaks] == 0
+
+    freq_hz = (bin_min + peak_offset) * freq_resolution
+    freq_hz[silent] = 0.0
+    voiced = freq_hz > 0
+    midi = np.full(sd.frames, np.nan)
+    midi[voiced] = 69.0 + 12.0 * np.log2(freq_hz[voiced] / 440.0)
+    times = np.arange(sd.frames) * hop / sr
+
+    # Only a handful of distinct notes occur: name each once, then scatter
+    notes = np.full(sd.frames, '—', dtype=object)
+    uniq, inverse = np.unique(np.round(midi[voiced]), return_inverse=True)
+    notes[voiced] = np.array([_midi_to_note(n) for n in uniq], dtype=object)[inverse]
+    return list(zip(times.tolist(), freq_hz.tolist(), midi.tolist(), notes.tolist()))
 
 
 @click.command()
@@ -86,12 +98,9 @@ def main(input, output, fmin, fmax, fmt):
 
     sep = ',' if fmt == 'csv' else '\t'
     header = sep.join(['time_s', 'freq_hz', 'midi_note', 'note_name'])
-    lines = [header]
-    for time_s, freq_hz, midi, note in rows:
-        midi_str = f"{midi:.2f}" if not math.isnan(midi) else 'nan'
-        lines.append(f"{time_s:.4f}{sep}{freq_hz:.2f}{sep}{midi_str}{sep}{note}")
-
-    text = '\n'.join(lines) + '\n'
+    # One %-format per row, driven from C by map(); '%.2f' already renders NaN as 'nan'
+    row_fmt = sep.join(['%.4f', '%.2f', '%.2f', '%s'])
+    text = header + '\n' + ''.join(map((row_fmt + '\n').__mod__, rows))
 
     if output:
         Path(output).write_text(text)
@@ -3,7 +3,7 @@
 import sys
 import numpy as np
 import click
-from soundplay.core.spectral import load, read_pipe
+from soundplay.core.spectral import load, read_pipe, _OP_BLOCK_BYTES
 from soundplay.core.audio import is_pipe
 
 # Equal temperament note names (chromatic scale)
@@ -67,8 +67,11 @@ def note_guidelines(fmin: float, fmax: float):
               help='Figure width in inches.')
 @click.option('--height', default=6.0, show_default=True,
               help='Figure height in inches.')
+@click.option('--log-exact', is_flag=True,
+              help='Draw one mesh cell per STFT bin (pcolormesh) instead of a single '
+                   'image. Slower; only differs in how cells map onto the log axis.')
 def main(input, output, channel, notes, note_labels, all_notes, db_range,
-         fmin, fmax, colormap, title, dpi, width, height):
+         fmin, fmax, colormap, title, dpi, width, height, log_exact):
     """Visualize a .spx spectral file as a PNG spectrogram.
 
     \b
@@ -106,7 +109,14 @@ def main(input, output, channel, notes, note_labels, all_notes, db_range,
 
     # Select channel
     if channel == -1:
-        mag_ch = np.abs(sd.stft).mean(axis=0)  # (frames, bins)
+        # Average the channel magnitudes through one reused scratch buffer,
+        # never holding all channels' magnitudes at once
+        mag_ch = np.abs(sd.stft[0])  # (frames, bins)
+        if sd.channels > 1:
+            scratch = np.empty_like(mag_ch)
+            for ch in range(1, sd.channels):
+                mag_ch += np.abs(sd.stft[ch], out=scratch)
+            mag_ch /= sd.channels
     else:
         if channel >= sd.channels:
             raise click.BadParameter(
@@ -115,39 +125,77 @@ def main(input, output, channel, notes, note_labels, all_notes, db_range,
             )
         mag_ch = np.abs(sd.stft[channel])  # (frames, bins)
 
-    # Convert to dB
-    db = 20.0 * np.log10(np.maximum(mag_ch, 1e-10))
-    db_max = db.max()
+    # Convert to dB in place (mag_ch is a fresh array). log10 is monotonic, so the
+    # peak comes from the magnitudes and the 1e-10 floor and the bottom of the
+    # display range fold into one clamp before the log — no separate clip pass
+    peak = max(float(mag_ch.max()), 1e-10)
+    db_max = 20.0 * np.log10(peak)
     db_min = db_max - db_range
-    db = np.clip(db, db_min, db_max)
+    floor = max(peak * 10.0 ** (-db_range / 20.0), 1e-10)
+    db = mag_ch
+    # Clamp, log and scale each ~2 MiB block of frames while it is still in cache
+    block = max(1, _OP_BLOCK_BYTES // (db.shape[1] * db.itemsize))
+    for t0 in range(0, db.shape[0], block):
+        rows = db[t0:t0 + block]
+        np.maximum(rows, floor, out=rows)
+        np.log10(rows, out=rows)
+        rows *= 20.0
 
     # Frequency and time axes
-    nyquist = sd.sample_rate / 2.0
-    freq_bins = np.linspace(0, nyquist, sd.bins)
+    nyquist = sd.nyquist
+    freq_bins = sd.freq_bins
     # Time axis: centre of each frame
-    time_axis = np.arange(sd.frames) * sd.hop_length / sd.sample_rate
+    dt = sd.hop_length / sd.sample_rate
+    time_axis = np.arange(sd.frames) * dt
 
     f_max = fmax if fmax is not None else nyquist
     f_max = min(f_max, nyquist)
 
+    # Far more frames than the canvas is pixels wide: max-pool runs of frames
+    # down to about one column per pixel (the max keeps transients visible),
+    # so the renderer is never handed detail it cannot draw
+    db_display = db
+    time_display = time_axis
+    target_w = int(width * dpi)
+    if sd.frames > 4 * target_w:
+        pool = sd.frames // target_w
+        starts = np.arange(0, sd.frames, pool)
+        db_display = np.maximum.reduceat(db, starts, axis=0)
+        time_display = (time_axis[starts] + time_axis[np.minimum(starts + pool, sd.frames) - 1]) / 2
+
     # Trim to frequency range for display
     freq_mask = (freq_bins >= fmin) & (freq_bins <= f_max)
     freq_display = freq_bins[freq_mask]
-    db_display = db[:, freq_mask]  # (frames, display_bins)
+    db_display = db_display[:, freq_mask]  # (columns, display_bins)
 
     # -----------------------------------------------------------------------
     # Plot
     # -----------------------------------------------------------------------
     fig, ax = plt.subplots(figsize=(width, height))
 
-    # pcolormesh: X=time, Y=freq, C=magnitude
-    # db_display is (frames, bins) → we need (bins, frames) for pcolormesh
-    im = ax.pcolormesh(
-        time_axis, freq_display, db_display.T,
-        shading='auto', cmap=colormap,
-        vmin=db_min, vmax=db_max,
-        rasterized=True,
-    )
+    if log_exact:
+        # pcolormesh: X=time, Y=freq, C=magnitude
+        # db_display is (columns, bins) → we need (bins, columns) for pcolormesh
+        im = ax.pcolormesh(
+            time_display, freq_display, db_display.T,
+            shading='auto', cmap=colormap,
+            vmin=db_min, vmax=db_max,
+            rasterized=True,
+        )
+    else:
+        # Both axes are evenly spaced, so one image primitive replaces a quad per
+        # (frame, bin). Cells are centred on their frame/bin like shading='auto';
+        # the DC bin has no place on a log axis, so it is left out.
+        positive = freq_display > 0
+        df = sd.sample_rate / sd.n_fft
+        f_img = freq_display[positive]
+        im = ax.imshow(
+            db_display[:, positive].T,
+            aspect='auto', origin='lower', interpolation='nearest',
+            extent=(time_axis[0] - dt / 2, time_axis[-1] + dt / 2,
+                    f_img[0] - df / 2, f_img[-1] + df / 2),
+            cmap=colormap, vmin=db_min, vmax=db_max,
+        )
 
     ax.set_yscale('log')
     ax.set_ylim(max(fmin, freq_display[freq_display > 0].min()), f_max)
@@ -172,26 +220,28 @@ def main(input, output, channel, notes, note_labels, all_notes, db_range,
     # -----------------------------------------------------------------------
     if notes or note_labels or all_notes:
         guide_notes = note_guidelines(fmin, f_max)
-
-        for hz, name, is_c in guide_notes:
-            if not all_notes and not is_c:
-                # Draw thin line for every note, but only label C notes
-                ax.axhline(hz, color='white', linewidth=0.3, alpha=0.25, linestyle='--')
-                continue
-
-            # C notes (or all notes if --all-notes): more visible line
-            lw = 0.8 if is_c else 0.4
-            alpha = 0.6 if is_c else 0.4
-            ax.axhline(hz, color='white', linewidth=lw, alpha=alpha, linestyle='--')
-
-            # Label
-            if note_labels or all_notes:
-                ax.text(
-                    time_axis[-1], hz, f' {name}',
-                    color='white', fontsize=6,
-                    va='center', ha='left',
-                    clip_on=True,
-                )
+        c_hz = [hz for hz, _, is_c in guide_notes if is_c]
+        other_hz = [hz for hz, _, is_c in guide_notes if not is_c]
+        # One LineCollection per line style instead of an axhline artist per
+        # note; the y-axis transform spans the axes width just like axhline.
+        # Non-C notes get a thin faint line, or a more visible one with --all-notes
+        span = ax.get_yaxis_transform()
+        lw, alpha = (0.4, 0.4) if all_notes else (0.3, 0.25)
+        ax.hlines(other_hz, 0, 1, transform=span, colors='white',
+                  linewidth=lw, alpha=alpha, linestyle='--')
+        ax.hlines(c_hz, 0, 1, transform=span, colors='white',
+                  linewidth=0.8, alpha=0.6, linestyle='--')
+
+        # Labels: C notes always, every note with --all-notes
+        if note_labels or all_notes:
+            for hz, name, is_c in guide_notes:
+                if is_c or all_notes:
+                    ax.text(
+                        time_axis[-1], hz, f' {name}',
+                        color='white', fontsize=6,
+                        va='center', ha='left',
+                        clip_on=True,
+                    )
 
     fig.tight_layout()
     fig.savefig(output, dpi=dpi, bbox_inches='tight')
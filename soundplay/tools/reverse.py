@@ -1,38 +1,22 @@
 """sp-reverse: Reverse audio or spectral data along the time axis."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import AudioData, load, save_output, read_pipe, is_pipe
 from soundplay.core import spectral as sp
-
-_SPECTRAL_MAGIC = b'SPXF'
-
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
 
 def _reverse_audio(audio: AudioData) -> AudioData:
-    return AudioData(audio.samples[::-1].copy(), audio.sample_rate)
+    return AudioData(audio.samples[::-1], audio.sample_rate)
 
 
 def _reverse_spectral(sd: sp.SpectralData) -> sp.SpectralData:
     # Reverse along the time (frames) axis: stft shape is (channels, frames, bins)
     return sp.SpectralData(
-        stft=sd.stft[:, ::-1, :].copy(),
+        stft=sd.stft[:, ::-1, :],
         sample_rate=sd.sample_rate,
         n_fft=sd.n_fft,
         hop_length=sd.hop_length,
@@ -61,12 +45,12 @@ def main(input, output, fmt):
       cat song.wav | sp-reverse - out.wav
     """
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
     buffered = None
     if fmt_in is None:
-        fmt_in, buffered = _sniff_stream(sys.stdin.buffer)
+        fmt_in, buffered = sniff_stream(sys.stdin.buffer)
 
-    fmt_out = _detect_format(output) or fmt_in
+    fmt_out = detect_format(output) or fmt_in
 
     # ------------------------------------------------------------------ load
     if fmt_in == 'spectral':
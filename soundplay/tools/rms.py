@@ -1,22 +1,27 @@
 """sp-rms: Measure RMS and peak levels over sliding windows."""
 
 import sys
-import math
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import click
-from pathlib import Path
 from soundplay.core.audio import AudioData, load, read_pipe, is_pipe
 
 _SILENCE_DB = -96.0
+_WRITE_BLOCK_ROWS = 8192  # rows formatted per write
 
 
-def _db(linear: float) -> float:
-    if linear <= 0.0:
-        return _SILENCE_DB
-    return max(_SILENCE_DB, 20.0 * math.log10(linear))
+def _db(linear: np.ndarray) -> np.ndarray:
+    """Linear levels → dBFS, floored at _SILENCE_DB (silence included)."""
+    with np.errstate(divide='ignore'):
+        db = 20.0 * np.log10(linear)
+    return np.maximum(db, _SILENCE_DB, out=db)
 
 
-def _rms_track(audio: AudioData, window_s: float, hop_s: float) -> list[tuple[float, float, float]]:
+def _rms_track(audio: AudioData, window_s: float, hop_s: float) -> np.ndarray:
+    """
+    (windows, 3) float64 rows of [time_s, rms_db, peak_db], one per hop. The
+    trailing windows run past the end and are measured over what remains.
+    """
     sr = audio.sample_rate
     win_frames = max(1, int(round(window_s * sr)))
     hop_frames = max(1, int(round(hop_s * sr)))
@@ -27,18 +32,38 @@ def _rms_track(audio: AudioData, window_s: float, hop_s: float) -> list[tuple[fl
     else:
         mono = audio.samples[:, 0]
 
-    rows = []
-    pos = 0
-    while pos < total:
-        segment = mono[pos:pos + win_frames]
-        time_s = pos / sr
-        rms_lin = float(np.sqrt(np.mean(segment ** 2)))
-        peak_lin = float(np.max(np.abs(segment)))
-        rows.append((time_s, _db(rms_lin), _db(peak_lin)))
-        pos += hop_frames
+    if not total:
+        return np.empty((0, 3))
+    starts = np.arange(0, total, hop_frames)
+    # Zero-pad so every hop has a full window: zeros add nothing to the sum of
+    # squares or the peak, and the RMS divides by the real segment length
+    span = starts[-1] + win_frames
+    padded = np.zeros(span, dtype=np.float32)
+    padded[:min(span, total)] = mono[:span]
+    windows = sliding_window_view(padded, win_frames)[::hop_frames]  # zero-copy
+    lengths = np.minimum(total - starts, win_frames)
+
+    rows = np.empty((len(starts), 3))
+    rows[:, 0] = starts / sr
+    rows[:, 1] = np.einsum('ij,ij->i', windows, windows)
+    rows[:, 1] /= lengths
+    np.sqrt(rows[:, 1], out=rows[:, 1])
+    # max/-min instead of abs(): no (windows, win_frames) temporary
+    rows[:, 2] = np.maximum(windows.max(axis=1), -windows.min(axis=1))
+    rows[:, 1:] = _db(rows[:, 1:])
     return rows
 
 
+def _write_table(rows: np.ndarray, sep: str, stream) -> None:
+    """Write the header and rows to stream a block at a time, never the whole table as one string."""
+    stream.write(sep.join(['time_s', 'rms_db', 'peak_db']) + '\n')
+    # e.g. '0.1000\t-20.00\t-14.00\n'
+    row_fmt = sep.join(['%.4f', '%.2f', '%.2f']) + '\n'
+    for start in range(0, len(rows), _WRITE_BLOCK_ROWS):
+        block = rows[start:start + _WRITE_BLOCK_ROWS]
+        stream.write(''.join(map(row_fmt.__mod__, zip(*block.T.tolist()))))
+
+
 @click.command()
 @click.argument('input', default=None, required=False)
 @click.option('--output', default=None, help='Output file. Defaults to stdout.')
@@ -75,15 +100,9 @@ def main(input, output, window, hop, fmt):
     rows = _rms_track(audio, window, hop_s)
 
     sep = ',' if fmt == 'csv' else '\t'
-    header = sep.join(['time_s', 'rms_db', 'peak_db'])
-    lines = [header]
-    for time_s, rms_db, peak_db in rows:
-        lines.append(f"{time_s:.4f}{sep}{rms_db:.2f}{sep}{peak_db:.2f}")
-
-    text = '\n'.join(lines) + '\n'
-
     if output:
-        Path(output).write_text(text)
+        with open(output, 'w') as f:
+            _write_table(rows, sep, f)
         click.echo(f"Wrote {len(rows)} windows → {output}", err=True)
     else:
-        sys.stdout.write(text)
+        _write_table(rows, sep, sys.stdout)
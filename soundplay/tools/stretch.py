@@ -1,32 +1,45 @@
 """sp-stretch: Time-stretch a .spx file without pitch change."""
 
+from __future__ import annotations
+
 import sys
-import numpy as np
 import click
 from pathlib import Path
-from scipy.interpolate import interp1d
-from soundplay.core.spectral import SpectralData, load, read_pipe, save, write_pipe
-from soundplay.core.audio import is_pipe
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from soundplay.core.spectral import SpectralData
 
 
 def _stretch(sd: SpectralData, factor: float) -> SpectralData:
+    import numpy as np
+    from soundplay.core.spectral import SpectralData, _map_channels
+
     frames = sd.frames
     new_frames = max(1, round(frames * factor))
 
-    src = np.linspace(0, 1, frames)
-    dst = np.linspace(0, 1, new_frames)
+    # Linear interpolation along frames: every output frame gathers its two
+    # neighbouring source frames and blends them with per-frame float32 weights,
+    # so the result stays complex64 with no separate real/imag passes
+    idx = np.linspace(0, frames - 1, new_frames)
+    lo = np.floor(idx).astype(np.intp)
+    hi = np.minimum(lo + 1, frames - 1)
+    t = (idx - lo).astype(np.float32)
+    w_lo = (np.float32(1.0) - t)[:, np.newaxis]  # (new_frames, 1)
+    w_hi = t[:, np.newaxis]
 
     channels, _, bins = sd.stft.shape
-    new_stft = np.zeros((channels, new_frames, bins), dtype=np.complex64)
+    new_stft = np.empty((channels, new_frames, bins), dtype=np.complex64)
 
-    for ch in range(channels):
-        real = sd.stft[ch].real  # (frames, bins)
-        imag = sd.stft[ch].imag
-        interp_r = interp1d(src, real, axis=0, bounds_error=False,
-                            fill_value=(real[0], real[-1]))
-        interp_i = interp1d(src, imag, axis=0, bounds_error=False,
-                            fill_value=(imag[0], imag[-1]))
-        new_stft[ch] = (interp_r(dst) + 1j * interp_i(dst)).astype(np.complex64)
+    def _one(ch):
+        out = new_stft[ch]
+        np.take(sd.stft[ch], lo, axis=0, out=out)
+        out *= w_lo
+        buf = np.take(sd.stft[ch], hi, axis=0)
+        buf *= w_hi
+        out += buf
+
+    _map_channels(_one, channels)
 
     new_original_frames = round(sd.original_frames * factor)
 
@@ -62,6 +75,10 @@ def main(factor, input, output):
       sp-stretch 0.5 song.spx fast.spx
       cat song.spx | sp-stretch 1.5 - out.spx
     """
+    # Deferred so --help and argument errors never pay for numpy
+    from soundplay.core.spectral import load, read_pipe, save, write_pipe
+    from soundplay.core.audio import is_pipe
+
     if factor <= 0:
         raise click.UsageError("FACTOR must be positive")
 
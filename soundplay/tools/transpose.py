@@ -1,13 +1,15 @@
 """sp-transpose: Pitch-shift a .spx file by shifting frequency bins."""
 
+from __future__ import annotations
+
 import sys
 import re
-import numpy as np
 import click
 from pathlib import Path
-from scipy.interpolate import interp1d
-from soundplay.core.spectral import SpectralData, load, read_pipe, save, write_pipe
-from soundplay.core.audio import is_pipe
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from soundplay.core.spectral import SpectralData
 
 
 def _parse_semitones(value: str) -> float:
@@ -20,21 +22,76 @@ def _parse_semitones(value: str) -> float:
 
 
 def _transpose(sd: SpectralData, semitones: float) -> SpectralData:
-    factor = 2.0 ** (semitones / 12.0)
-    bins = sd.bins
-    src_bins = np.arange(bins, dtype=np.float64)
-    # Output bin b samples input at b / factor
-    dst_bins = src_bins / factor
+    """
+    Shift every bin's content up or down by 2^(semitones/12) in frequency.
 
-    channels, frames, _ = sd.stft.shape
-    new_stft = np.zeros_like(sd.stft)
+    Magnitudes are interpolated linearly across bins. Phases are not
+    interpolated (blending rotating phasors cancels them out): each output
+    bin takes the phase track of its nearest source bin, re-accumulated from
+    that bin's measured per-hop phase advance scaled by the same factor, so
+    shifted partials keep turning at their new frequencies.
+    """
+    import numpy as np
+    from soundplay.core.spectral import SpectralData, _OP_BLOCK_BYTES, _map_channels
 
-    for ch in range(channels):
-        real = sd.stft[ch].real  # (frames, bins)
-        imag = sd.stft[ch].imag
-        interp_r = interp1d(src_bins, real, axis=1, bounds_error=False, fill_value=0.0)
-        interp_i = interp1d(src_bins, imag, axis=1, bounds_error=False, fill_value=0.0)
-        new_stft[ch] = (interp_r(dst_bins) + 1j * interp_i(dst_bins)).astype(np.complex64)
+    factor = 2.0 ** (semitones / 12.0)
+    channels, frames, bins = sd.stft.shape
+    # Output bin b reads input position b / factor; bins that land beyond the
+    # top input bin stay silent
+    pos = np.arange(bins, dtype=np.float64) / factor
+    n_out = int(np.searchsorted(pos, bins - 1, side='right'))
+    pos = pos[:n_out]
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, bins - 1)
+    t = (pos - lo).astype(np.float32)
+    w_lo = np.float32(1.0) - t
+    near = np.rint(pos).astype(np.intp)
+    # Frames are phase-referenced at their start, which puts a pi-per-bin slope
+    # across every partial's lobe; the phase tracks are kept relative to the
+    # window centre instead, so neighbouring output bins that share a source
+    # bin stay coherent
+    centre = np.pi * np.arange(bins)
+    # Phase advance per hop of each source bin's centre frequency
+    omega = (2.0 * np.pi * sd.hop_length / sd.n_fft) * near
+
+    new_stft = np.zeros(sd.stft.shape, dtype=np.complex64)
+    block = max(1, _OP_BLOCK_BYTES // (bins * 8))
+
+    # Each channel carries its own phase state through its frame blocks
+    def _one(ch):
+        prev = None  # last input phase of the previous block, at the near bins
+        acc = None   # last output phase of the previous block
+        for f0 in range(0, frames, block):
+            src = sd.stft[ch, f0:f0 + block]
+            mag = np.abs(src)
+            out_mag = mag[:, lo] * w_lo
+            out_mag += mag[:, hi] * t
+
+            phase = np.angle(src[:, near]).astype(np.float64)
+            # Measured advance: the expected omega plus the deviation from it,
+            # wrapped to (-pi, pi]; scaled by factor and summed along frames
+            adv = np.diff(phase, axis=0, prepend=phase[:1] if prev is None else prev[np.newaxis])
+            adv -= omega
+            adv -= (2.0 * np.pi) * np.round(adv * (0.5 / np.pi))
+            adv += omega
+            adv *= factor
+            if acc is None:
+                adv[0] = phase[0] + centre[near]
+            else:
+                adv[0] += acc
+            out_phase = np.cumsum(adv, axis=0, out=adv)
+            prev = phase[-1]
+            acc = np.mod(out_phase[-1], 2.0 * np.pi)
+
+            out_phase -= centre[:n_out]
+            # Wrapped first, so float32 keeps the precision for cheap float32 trig
+            out_phase -= (2.0 * np.pi) * np.round(out_phase * (0.5 / np.pi))
+            ph = out_phase.astype(np.float32)
+            out = new_stft[ch, f0:f0 + block, :n_out]
+            out.real = out_mag * np.cos(ph)
+            out.imag = out_mag * np.sin(ph)
+
+    _map_channels(_one, channels)
 
     return SpectralData(
         stft=new_stft,
@@ -65,6 +122,10 @@ def main(semitones, input, output):
       sp-transpose -7 song.spx - | sp-resynth - out.wav
       sp-transpose 100c song.spx song_100c.spx
     """
+    # Deferred so --help and argument errors never pay for numpy
+    from soundplay.core.spectral import load, read_pipe, save, write_pipe
+    from soundplay.core.audio import is_pipe
+
     try:
         st = _parse_semitones(semitones)
     except ValueError:
@@ -1,37 +1,13 @@
 """sp-trim: Trim an audio or spectral file to a time range."""
 
 import sys
-import io
 import numpy as np
 import click
 from pathlib import Path
 from soundplay.core.audio import load_input, save_output, AudioData, is_pipe
 from soundplay.core import spectral as sp
 from soundplay.core.timeutil import TIME, resolve as resolve_time
-
-
-_SPECTRAL_MAGIC = b'SPXF'
-_AUDIO_MAGIC    = b'SPAW'
-
-
-def _sniff_stream(stream) -> tuple[str, object]:
-    """
-    Peek at the first 4 bytes of a binary stream to determine format.
-    Returns (format, buffered_stream) where format is 'spectral' or 'audio'
-    and buffered_stream has the bytes put back.
-    """
-    header = stream.read(4)
-    buffered = io.BytesIO(header + stream.read())
-    fmt = 'spectral' if header == _SPECTRAL_MAGIC else 'audio'
-    return fmt, buffered
-
-
-def _detect_format(path: str | None) -> str | None:
-    """Return 'spectral', 'audio', or None (needs sniffing) from file extension."""
-    if path is None or path == '-':
-        return None
-    ext = Path(path).suffix.lower()
-    return 'spectral' if ext == '.spx' else 'audio'
+from soundplay.core.io_sniff import detect_format, sniff_stream
 
 
 def _resolve_times(start_raw, end_raw, duration_raw, total: float) -> tuple[float, float]:
@@ -60,7 +36,7 @@ def _resolve_times(start_raw, end_raw, duration_raw, total: float) -> tuple[floa
 def _trim_audio(audio: AudioData, start_s: float, end_s: float) -> AudioData:
     s = int(round(start_s * audio.sample_rate))
     e = int(round(end_s   * audio.sample_rate))
-    return AudioData(audio.samples[s:e].copy(), audio.sample_rate)
+    return AudioData(audio.samples[s:e], audio.sample_rate)
 
 
 def _trim_spectral(sd: sp.SpectralData, start_s: float, end_s: float) -> sp.SpectralData:
@@ -68,7 +44,7 @@ def _trim_spectral(sd: sp.SpectralData, start_s: float, end_s: float) -> sp.Spec
     ef = int(round(end_s   * sd.sample_rate / sd.hop_length))
     sf = max(0, min(sf, sd.frames))
     ef = max(sf, min(ef, sd.frames))
-    new_stft = sd.stft[:, sf:ef, :].copy()
+    new_stft = sd.stft[:, sf:ef, :]
     new_orig  = int(round((end_s - start_s) * sd.sample_rate))
     return sp.SpectralData(
         stft=new_stft,
@@ -119,17 +95,17 @@ def main(input, output, start, end, duration, fmt):
         raise click.UsageError("--end and --duration are mutually exclusive")
 
     # ------------------------------------------------------------------ format
-    fmt_in = _detect_format(input)
+    fmt_in = detect_format(input)
 
     if fmt_in is None:
         # Pipe: sniff magic bytes
-        raw_fmt, buffered = _sniff_stream(sys.stdin.buffer)
+        raw_fmt, buffered = sniff_stream(sys.stdin.buffer)
         fmt_in = raw_fmt
     else:
         buffered = None
 
     # Infer output format from output path if not specified
-    fmt_out = _detect_format(output)
+    fmt_out = detect_format(output)
     if fmt_out is None:
         fmt_out = fmt_in  # same as input by default
 
@@ -1,11 +1,14 @@
 """Tests for soundplay.core.audio."""
 
 import io
+import sys
+import types
+
 import numpy as np
 import pytest
 
 from soundplay.core.audio import (
-    AudioData, load, save, read_pipe, write_pipe,
+    AudioData, load, save, read_pipe, write_pipe, save_output_blocks,
 )
 
 
@@ -35,6 +38,11 @@ class TestChannelConversion:
         expected = stereo_audio.samples.mean(axis=1, keepdims=True)
         np.testing.assert_allclose(m.samples, expected, atol=1e-6)
 
+    def test_upmixed_stereo_to_mono(self, mono_audio):
+        m = mono_audio.as_stereo().as_mono()
+        assert m.channels == 1
+        np.testing.assert_array_equal(m.samples, mono_audio.samples)
+
     def test_mono_as_mono_returns_self(self, mono_audio):
         assert mono_audio.as_mono() is mono_audio
 
@@ -71,6 +79,33 @@ class TestFileIO:
         with pytest.raises(ValueError, match="Unsupported"):
             save(mono_audio, tmp_path / "test.xyz")
 
+    def test_save_output_blocks_matches_save(self, stereo_audio, tmp_path):
+        whole = tmp_path / "whole.flac"
+        blocks = tmp_path / "blocks.flac"
+        save(stereo_audio, whole)
+        parts = np.array_split(stereo_audio.samples, 3)
+        save_output_blocks(parts, stereo_audio.sample_rate, 2, stereo_audio.frames, str(blocks))
+        np.testing.assert_array_equal(load(blocks).samples, load(whole).samples)
+
+    def test_save_strided_view(self, stereo_audio, tmp_path):
+        path = tmp_path / "rev.flac"
+        save(AudioData(stereo_audio.samples[::-1], stereo_audio.sample_rate), path)
+        expected = tmp_path / "expected.flac"
+        save(AudioData(stereo_audio.samples[::-1].copy(), stereo_audio.sample_rate), expected)
+        np.testing.assert_array_equal(load(path).samples, load(expected).samples)
+
+    def test_pydub_24bit(self, tmp_path, monkeypatch):
+        ints = np.array([[0, -1], [(1 << 23) - 1, -(1 << 23)], [1 << 22, -(1 << 22)]], dtype='<i4')
+        raw = ints.astype('<i4').view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+        seg = types.SimpleNamespace(frame_rate=44100, channels=2, sample_width=3, raw_data=raw)
+        fake = types.ModuleType('pydub')
+        fake.AudioSegment = types.SimpleNamespace(from_file=lambda path: seg)
+        monkeypatch.setitem(sys.modules, 'pydub', fake)
+        loaded = load(tmp_path / "in.mp3")
+        assert loaded.sample_rate == 44100
+        assert loaded.samples.dtype == np.float32
+        np.testing.assert_allclose(loaded.samples, ints / 2**23, atol=1e-7)
+
 
 class TestPipeRoundtrip:
     def test_pipe_roundtrip(self, mono_audio):
@@ -90,6 +125,30 @@ class TestPipeRoundtrip:
         assert loaded.channels == 2
         np.testing.assert_array_equal(loaded.samples, stereo_audio.samples)
 
+    def test_pipe_roundtrip_multi_chunk(self):
+        # Body larger than one pipe write chunk
+        audio = AudioData(np.random.rand(40000, 2).astype(np.float32) - 0.5, 16000)
+        buf = io.BytesIO()
+        write_pipe(audio, buf)
+        buf.seek(0)
+        np.testing.assert_array_equal(read_pipe(buf).samples, audio.samples)
+
+    def test_pipe_strided_view(self):
+        samples = np.random.rand(40000, 2).astype(np.float32) - 0.5
+        buf = io.BytesIO()
+        write_pipe(AudioData(samples[::-1], 16000), buf)
+        buf.seek(0)
+        np.testing.assert_array_equal(read_pipe(buf).samples, samples[::-1])
+
+    def test_pipe_roundtrip_empty(self):
+        audio = AudioData(np.zeros((0, 2), dtype=np.float32), 16000)
+        buf = io.BytesIO()
+        write_pipe(audio, buf)
+        buf.seek(0)
+        loaded = read_pipe(buf)
+        assert loaded.frames == 0
+        assert loaded.channels == 2
+
     def test_incomplete_header_raises(self):
         buf = io.BytesIO(b'\x00' * 4)
         with pytest.raises(ValueError, match="Incomplete"):
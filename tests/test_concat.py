@@ -3,6 +3,7 @@
 import numpy as np
 from click.testing import CliRunner
 
+from soundplay.core import spectral as sp
 from soundplay.core.audio import AudioData, load, save
 from soundplay.tools.concat import main
 
@@ -56,6 +57,15 @@ class TestConcatCLI:
         assert loaded.channels == 2
         assert loaded.frames == mono_audio.frames + stereo_audio.frames
 
+    def test_spectral_concat(self, spectral_data, spx_file, tmp_path):
+        out = tmp_path / "out.spx"
+        runner = CliRunner()
+        result = runner.invoke(main, [str(spx_file), str(spx_file), "-o", str(out)])
+        assert result.exit_code == 0, result.output
+        loaded = sp.load(out)
+        assert loaded.frames == spectral_data.frames * 2
+        np.testing.assert_array_equal(loaded.stft[:, spectral_data.frames:], spectral_data.stft)
+
     def test_single_file_errors(self, wav_file):
         runner = CliRunner()
         result = runner.invoke(main, [str(wav_file)])
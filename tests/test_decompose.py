@@ -0,0 +1,36 @@
+"""Tests for sp-decompose."""
+
+import numpy as np
+from click.testing import CliRunner
+
+from soundplay.core.spectral import load
+from soundplay.tools.decompose import _apply_mask, _bin_owners, _save_masked, main
+
+
+class TestDecompose:
+    def test_save_masked_matches_apply_mask(self, spectral_data, tmp_path):
+        mask = np.zeros(spectral_data.bins, dtype=bool)
+        mask[20:40] = True
+        out = tmp_path / "masked.spx"
+        _save_masked(spectral_data, mask, out)
+        loaded = load(out)
+        np.testing.assert_array_equal(loaded.stft, _apply_mask(spectral_data, mask).stft)
+        assert loaded.original_frames == spectral_data.original_frames
+
+    def test_bin_owners_first_claim_wins(self):
+        freq_bins = np.linspace(0, 8000, 1025)  # 7.8125 Hz per bin
+        owner = _bin_owners([125.0, 250.0], freq_bins, bin_window=1, max_harmonics=4)
+        # 250 Hz is 125 Hz's 2nd harmonic: those bins stay with the first note
+        assert (owner[31:34] == 0).all()
+        assert (owner[95:98] == 1).all()  # 750 Hz: 3rd harmonic of 250 only
+        assert owner[0] == -1
+        assert (owner >= 0).sum() == 4 * 3 + 2 * 3
+
+    def test_components_sum_to_original(self, spx_file, spectral_data, tmp_path):
+        runner = CliRunner()
+        result = runner.invoke(main, [str(spx_file), "--output-dir", str(tmp_path / "out")])
+        assert result.exit_code == 0, result.output
+        files = sorted((tmp_path / "out").glob("*.spx"))
+        assert any(f.stem.endswith("_remainder") for f in files)
+        total = sum(load(f).stft for f in files)
+        np.testing.assert_array_equal(total, spectral_data.stft)
@@ -0,0 +1,26 @@
+"""Tests for sp-expand."""
+
+import numpy as np
+
+from soundplay.tools.expand import _pad_audio, _pad_spectral
+
+
+class TestExpand:
+    def test_pad_audio(self, stereo_audio):
+        sr = stereo_audio.sample_rate
+        result = _pad_audio(stereo_audio, 0.5, 0.25)
+        ns = int(round(0.5 * sr))
+        assert result.frames == stereo_audio.frames + ns + int(round(0.25 * sr))
+        assert not result.samples[:ns].any()
+        assert not result.samples[ns + stereo_audio.frames:].any()
+        np.testing.assert_array_equal(result.samples[ns:ns + stereo_audio.frames],
+                                      stereo_audio.samples)
+
+    def test_pad_spectral(self, spectral_data):
+        sr, hop = spectral_data.sample_rate, spectral_data.hop_length
+        result = _pad_spectral(spectral_data, 0.5, 0.0)
+        fs = int(round(0.5 * sr / hop))
+        assert result.frames == spectral_data.frames + fs
+        assert not result.stft[:, :fs].any()
+        np.testing.assert_array_equal(result.stft[:, fs:], spectral_data.stft)
+        assert result.original_frames == spectral_data.original_frames + int(round(0.5 * sr))
@@ -1,10 +1,13 @@
 """Tests for sp-filter tool."""
 
+import io
+
 import numpy as np
 from click.testing import CliRunner
 
-from soundplay.core.audio import AudioData, load, save
-from soundplay.tools.filter import main
+from soundplay.core.audio import AudioData, load, read_pipe, save, write_pipe
+from soundplay.tools import filter as filter_tool
+from soundplay.tools.filter import _apply_filter, _filter_pipe, main
 
 
 SR = 16000
@@ -80,3 +83,18 @@ class TestFilterCLI:
         runner = CliRunner()
         result = runner.invoke(main, [str(wav_file), "--type", "bandpass", "--freq", "500"])
         assert result.exit_code != 0
+
+
+class TestFilterPipe:
+    def test_streamed_blocks_match_one_shot(self, stereo_audio, monkeypatch):
+        monkeypatch.setattr(filter_tool, "_STREAM_BLOCK_FRAMES", 1000)
+        src = io.BytesIO()
+        write_pipe(stereo_audio, src)
+        src.seek(0)
+        dst = io.BytesIO()
+        _filter_pipe(src, dst, "lowpass", 600.0, None, 4)
+        dst.seek(0)
+        streamed = read_pipe(dst)
+        expected = _apply_filter(stereo_audio.samples, SR, "lowpass", 600.0, None, 4)
+        assert streamed.frames == stereo_audio.frames
+        np.testing.assert_allclose(streamed.samples, expected, atol=1e-6)
@@ -59,3 +59,17 @@ class TestMixCLI:
         runner = CliRunner()
         result = runner.invoke(main, [str(wav_file)])
         assert result.exit_code != 0
+
+    def test_mono_spreads_into_stereo_mix(self, mono_audio, stereo_audio, tmp_path):
+        a = tmp_path / "mono.wav"
+        b = tmp_path / "stereo.wav"
+        out = tmp_path / "out.wav"
+        save(mono_audio, a)
+        save(stereo_audio, b)
+        runner = CliRunner()
+        result = runner.invoke(main, [str(a), str(b), "-w", "1.0,0.0", "-o", str(out)])
+        assert result.exit_code == 0, result.output
+        loaded = load(out)
+        assert loaded.channels == 2
+        np.testing.assert_allclose(loaded.samples[:, 0], loaded.samples[:, 1])
+        np.testing.assert_allclose(loaded.samples[:, :1], mono_audio.samples, atol=1e-3)
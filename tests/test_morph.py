@@ -59,3 +59,24 @@ class TestMorph:
         assert result.sample_rate == sd1.sample_rate
         assert result.n_fft == sd1.n_fft
         assert result.hop_length == sd1.hop_length
+
+    def test_resample_matches_np_interp(self):
+        rng = np.random.default_rng(0)
+        sd1 = _make_sd(0.0 + 0j, frames=19, channels=2)
+        stft2 = (rng.standard_normal((2, 7, BINS))
+                 + 1j * rng.standard_normal((2, 7, BINS))).astype(np.complex64)
+        sd2 = SpectralData(stft2, SR, N_FFT, HOP, 'hann', 7 * HOP)
+        result = _morph(sd1, sd2, blend_start=1.0, blend_end=1.0)
+        src = np.linspace(0, 1, 7)
+        dst = np.linspace(0, 1, 19)
+        for ch in range(2):
+            for b in (0, 100, BINS - 1):
+                expected = (np.interp(dst, src, stft2[ch, :, b].real)
+                            + 1j * np.interp(dst, src, stft2[ch, :, b].imag))
+                np.testing.assert_allclose(result.stft[ch, :, b], expected, atol=1e-5)
+
+    def test_single_frame_input2_holds_constant(self):
+        sd1 = _make_sd(0.0 + 0j, frames=10)
+        sd2 = _make_sd(0.5 + 0.25j, frames=1)
+        result = _morph(sd1, sd2, blend_start=1.0, blend_end=1.0)
+        np.testing.assert_allclose(result.stft, 0.5 + 0.25j, atol=1e-6)
@@ -4,7 +4,8 @@ import numpy as np
 from click.testing import CliRunner
 
 from soundplay.core.audio import AudioData, load, save
-from soundplay.tools.normalize import main
+from soundplay.core.spectral import SpectralData, compute_istft, compute_stft, save as spx_save
+from soundplay.tools.normalize import _normalize_spectral, _spectral_rms, main
 
 
 class TestNormalizeCLI:
@@ -57,3 +58,43 @@ class TestNormalizeCLI:
         peak = np.max(np.abs(loaded.samples))
         target = 10.0 ** (-3.0 / 20.0)
         np.testing.assert_allclose(peak, target, atol=0.02)
+
+    def test_hot_spectral_to_audio_not_flattened(self, mono_audio, tmp_path):
+        # Resynthesis peaks at 2.0: normalizing to -6 dBFS must scale the
+        # waveform, not clip it at 1.0 first
+        sd = compute_stft(mono_audio.samples * 2.0, mono_audio.sample_rate)
+        inp = tmp_path / "hot.spx"
+        out = tmp_path / "out.wav"
+        spx_save(sd, inp)
+        result = CliRunner().invoke(main, [str(inp), str(out), '--target', '-6'])
+        assert result.exit_code == 0, result.output
+        samples = load(out).samples
+        expected = compute_istft(sd, clip=False)
+        expected *= 10 ** (-6 / 20) / np.abs(expected).max()
+        np.testing.assert_allclose(samples[:len(expected)], expected, atol=2e-4)
+
+
+class TestSpectralRms:
+    def test_matches_resynth_rms(self, stereo_audio):
+        for n_fft, hop, window in [(2048, 512, 'hann'), (512, 128, 'hamming')]:
+            sd = compute_stft(stereo_audio.samples, stereo_audio.sample_rate,
+                              n_fft=n_fft, hop_length=hop, window=window)
+            samples = compute_istft(sd).astype(np.float64)
+            expected = np.sqrt(np.mean(samples ** 2))
+            np.testing.assert_allclose(_spectral_rms(sd), expected, rtol=5e-3)
+
+    def test_modified_stft_uses_resynth_level(self, mono_audio):
+        # Randomised phases: the frames no longer overlap-add consistently, so
+        # Parseval overestimates the level; the default measurement must not
+        sd = compute_stft(mono_audio.samples, mono_audio.sample_rate)
+        rng = np.random.default_rng(0)
+        phase = np.exp(1j * rng.uniform(-np.pi, np.pi, sd.stft.shape)).astype(np.complex64)
+        modified = SpectralData(np.abs(sd.stft) * phase, sd.sample_rate, sd.n_fft,
+                                sd.hop_length, sd.window, sd.original_frames)
+        out = compute_istft(_normalize_spectral(modified, -20.0, 'rms')).astype(np.float64)
+        rms_db = 20 * np.log10(np.sqrt(np.mean(out ** 2)))
+        np.testing.assert_allclose(rms_db, -20.0, atol=0.1)
+        # The opt-in estimate is the one that drifts here
+        fast = compute_istft(_normalize_spectral(modified, -20.0, 'rms', fast_rms=True))
+        fast_db = 20 * np.log10(np.sqrt(np.mean(fast.astype(np.float64) ** 2)))
+        assert abs(fast_db + 20.0) > 1.0
@@ -1,10 +1,11 @@
 """Tests for sp-rms."""
 
+import io
 import math
 import numpy as np
 import pytest
 from soundplay.core.audio import AudioData
-from soundplay.tools.rms import _rms_track, _SILENCE_DB
+from soundplay.tools.rms import _rms_track, _write_table, _SILENCE_DB, _WRITE_BLOCK_ROWS
 
 SR = 16000
 
@@ -71,3 +72,27 @@ class TestRmsTrack:
         _, rms_db, peak_db = rows[0]
         assert abs(rms_db - (-9.03)) < 0.5
         assert abs(peak_db - (-6.02)) < 0.5
+
+    def test_partial_trailing_window(self):
+        # 0.25s at 0.1s hops: the last window holds only 0.05s of signal
+        samples = np.zeros(SR // 4, dtype=np.float32)
+        samples[-SR // 20:] = 0.5
+        rows = _rms_track(_make_audio(samples), window_s=0.1, hop_s=0.1)
+        assert len(rows) == 3
+        _, rms_db, peak_db = rows[-1]
+        # RMS over the remaining samples only, not the zero-padded window
+        assert rms_db == pytest.approx(20 * math.log10(0.5), abs=0.01)
+        assert peak_db == pytest.approx(20 * math.log10(0.5), abs=0.01)
+
+
+class TestWriteTable:
+    def test_rows_across_blocks(self):
+        n = _WRITE_BLOCK_ROWS + 3
+        rows = np.column_stack([np.arange(n) / 10, np.full(n, -3.0), np.full(n, _SILENCE_DB)])
+        out = io.StringIO()
+        _write_table(rows, '\t', out)
+        lines = out.getvalue().splitlines()
+        assert lines[0] == 'time_s\trms_db\tpeak_db'
+        assert len(lines) == n + 1
+        assert lines[1] == '0.0000\t-3.00\t-96.00'
+        assert lines[-1] == f'{(n - 1) / 10:.4f}\t-3.00\t-96.00'
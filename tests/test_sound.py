@@ -146,6 +146,12 @@ class TestTransforms:
         s2 = sound_from_audio.pad(start=0.5, end=0.5)
         assert abs(s2.duration - 2.0) < 0.01
 
+    def test_pad_places_samples(self, sound_from_audio):
+        s2 = sound_from_audio.pad(start=0.25)
+        ns = int(round(0.25 * s2.audio.sample_rate))
+        assert not s2.audio.samples[:ns].any()
+        np.testing.assert_array_equal(s2.audio.samples[ns:], sound_from_audio.audio.samples)
+
     def test_filter_lowpass(self, sound_from_audio):
         s2 = sound_from_audio.filter('lowpass', 200.0)
         assert isinstance(s2, Sound)
@@ -191,6 +197,9 @@ class TestAnalysis:
         rows = sound_from_audio.rms(window=0.1)
         assert len(rows) > 0
         assert len(rows[0]) == 3  # (time_s, rms_db, peak_db)
+        assert isinstance(rows, list)
+        assert all(isinstance(r, tuple) for r in rows)
+        assert all(type(v) is float for v in rows[0])
 
     def test_decompose(self, sound_from_audio):
         parts = sound_from_audio.decompose(max_notes=2)
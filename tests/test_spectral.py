@@ -1,11 +1,13 @@
 """Tests for soundplay.core.spectral."""
 
+import io
+import os
 import numpy as np
 import pytest
 
 from soundplay.core.spectral import (
     SpectralData, compute_stft, compute_istft,
-    save as spx_save, load as spx_load,
+    save as spx_save, load as spx_load, read_pipe, write_pipe, _advise,
 )
 
 
@@ -19,6 +21,13 @@ class TestSpectralDataProperties:
     def test_duration(self, spectral_data):
         assert spectral_data.duration == pytest.approx(1.0)
 
+    def test_freq_bins(self, spectral_data):
+        fb = spectral_data.freq_bins
+        assert fb is spectral_data.freq_bins
+        assert fb.shape == (spectral_data.bins,)
+        assert fb[-1] == spectral_data.nyquist == spectral_data.sample_rate / 2
+        assert not fb.flags.writeable
+
 
 class TestSpxRoundtrip:
     def test_save_load(self, spectral_data, tmp_path):
@@ -35,6 +44,107 @@ class TestSpxRoundtrip:
         )
 
 
+    def test_load_is_memory_mapped(self, spectral_data, spx_file):
+        loaded = spx_load(spx_file)
+        assert isinstance(loaded.stft, np.memmap)
+        np.testing.assert_array_equal(loaded.stft, spectral_data.stft)
+
+    def test_load_copy(self, spectral_data, spx_file):
+        loaded = spx_load(spx_file, copy=True)
+        assert not isinstance(loaded.stft, np.memmap)
+        assert loaded.stft.flags.writeable
+        np.testing.assert_array_equal(loaded.stft, spectral_data.stft)
+
+    def test_load_is_writable_copy_on_write(self, spectral_data, spx_file, tmp_path):
+        before = spx_file.read_bytes()
+        loaded = spx_load(spx_file)
+        loaded.stft *= 2
+        _advise(loaded.stft, 'MADV_DONTNEED')
+        np.testing.assert_array_equal(loaded.stft, spectral_data.stft * 2)
+        assert spx_file.read_bytes() == before
+        # The edited pages, not the file's, must reach the output
+        p = tmp_path / "scaled.spx"
+        spx_save(loaded, p)
+        np.testing.assert_array_equal(spx_load(p).stft, spectral_data.stft * 2)
+
+    def test_overwrite_mapped_source(self, spectral_data, spx_file):
+        loaded = spx_load(spx_file)
+        reversed_sd = SpectralData(loaded.stft[:, ::-1, :], loaded.sample_rate, loaded.n_fft,
+                                   loaded.hop_length, loaded.window, loaded.original_frames)
+        spx_save(reversed_sd, spx_file)
+        np.testing.assert_array_equal(spx_load(spx_file).stft, spectral_data.stft[:, ::-1, :])
+
+    def test_overwrite_mapped_source_via_links(self, spectral_data, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir()
+        spx_save(spectral_data, real / "a.spx")
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+        os.link(real / "a.spx", real / "hard.spx")
+        # Mapped through one name, overwritten through another: still the same file
+        for src, dst in ((tmp_path / "link" / "a.spx", tmp_path / "link" / "a.spx"),
+                         (real / "a.spx", real / "hard.spx")):
+            loaded = spx_load(src)
+            reversed_sd = SpectralData(loaded.stft[:, ::-1, :], loaded.sample_rate, loaded.n_fft,
+                                       loaded.hop_length, loaded.window, loaded.original_frames)
+            expected = np.array(reversed_sd.stft)
+            spx_save(reversed_sd, dst)
+            np.testing.assert_array_equal(spx_load(dst).stft, expected)
+
+    def test_save_memmapped_stft(self, spectral_data, spx_file, tmp_path):
+        # A memory-mapped body is copied file-to-file without a user-space pass
+        offset = spx_file.stat().st_size - spectral_data.stft.nbytes
+        mm = np.memmap(spx_file, dtype=np.complex64, mode='r', offset=offset,
+                       shape=spectral_data.stft.shape)
+        sd = SpectralData(mm, spectral_data.sample_rate, spectral_data.n_fft,
+                          spectral_data.hop_length, spectral_data.window,
+                          spectral_data.original_frames)
+        p = tmp_path / "copy.spx"
+        spx_save(sd, p)
+        assert p.read_bytes() == spx_file.read_bytes()
+
+    def test_write_mapped_body_to_append_stream(self, spectral_data, spx_file, tmp_path):
+        # sendfile rejects O_APPEND outputs; the body must still be written in full
+        p = tmp_path / "appended.spx"
+        with open(p, 'ab') as f:
+            write_pipe(spx_load(spx_file), f)
+        assert p.read_bytes() == spx_file.read_bytes()
+
+    def test_pipe_roundtrip_exact(self, spectral_data):
+        buf = io.BytesIO()
+        write_pipe(spectral_data, buf)
+        buf.seek(0)
+        loaded = read_pipe(buf)
+        assert loaded.stft.dtype == np.complex64
+        np.testing.assert_array_equal(loaded.stft, spectral_data.stft)
+
+    def test_pipe_strided_view(self, spectral_data):
+        # Reversed views are written block by block, not copied up front
+        sd = SpectralData(spectral_data.stft[:, ::-1, :], spectral_data.sample_rate,
+                          spectral_data.n_fft, spectral_data.hop_length,
+                          spectral_data.window, spectral_data.original_frames)
+        buf = io.BytesIO()
+        write_pipe(sd, buf)
+        buf.seek(0)
+        np.testing.assert_array_equal(read_pipe(buf).stft, spectral_data.stft[:, ::-1, :])
+
+    def test_truncated_body_raises(self, spectral_data):
+        buf = io.BytesIO()
+        write_pipe(spectral_data, buf)
+        with pytest.raises(ValueError, match="Truncated"):
+            read_pipe(io.BytesIO(buf.getvalue()[:-8]))
+
+    def test_full_spectrum_rejected(self, spectral_data):
+        sd = SpectralData(np.zeros((1, 4, spectral_data.n_fft), dtype=np.complex64),
+                          spectral_data.sample_rate, spectral_data.n_fft,
+                          spectral_data.hop_length, spectral_data.window, 2048)
+        buf = io.BytesIO()
+        write_pipe(sd, buf)
+        with pytest.raises(ValueError, match="bins"):
+            read_pipe(io.BytesIO(buf.getvalue()))
+        with pytest.raises(ValueError, match="one-sided"):
+            compute_istft(sd)
+
+
 class TestStftIstftAccuracy:
     def test_reconstruction(self, mono_audio):
         sd = compute_stft(mono_audio.samples, mono_audio.sample_rate)
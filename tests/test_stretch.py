@@ -53,3 +53,17 @@ class TestStretch:
         assert result.sample_rate == sd.sample_rate
         assert result.n_fft == sd.n_fft
         assert result.hop_length == sd.hop_length
+
+    def test_matches_linear_interp(self):
+        sd = _make_sd(frames=40)
+        result = _stretch(sd, 1.7)
+        src = np.linspace(0, 1, 40)
+        dst = np.linspace(0, 1, result.frames)
+        expected = np.interp(dst, src, sd.stft[0, :, 5].real)
+        np.testing.assert_allclose(result.stft[0, :, 5].real, expected, atol=1e-5)
+
+    def test_single_frame_repeats(self):
+        sd = _make_sd(frames=1)
+        result = _stretch(sd, 3.0)
+        assert result.frames == 3
+        np.testing.assert_array_equal(result.stft[0], np.repeat(sd.stft[0], 3, axis=0))
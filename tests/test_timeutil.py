@@ -3,7 +3,7 @@
 import pytest
 from click import Context, Command
 
-from soundplay.core.timeutil import TimeParam, resolve, TIME
+from soundplay.core.timeutil import TimeParam, TimeValue, resolve, TIME
 
 
 class TestTimeParamConvert:
@@ -11,13 +11,17 @@ class TestTimeParamConvert:
         return TIME.convert(value, None, None)
 
     def test_seconds_string(self):
-        assert self._convert("1.5") == "1.5"
+        assert self._convert("1.5") == TimeValue('sec', 1.5)
 
     def test_seconds_float(self):
-        assert self._convert(2.0) == "2.0"
+        assert self._convert(2.0) == TimeValue('sec', 2.0)
 
     def test_percentage(self):
-        assert self._convert("10%") == "10%"
+        assert self._convert("10%") == TimeValue('pct', 10.0)
+
+    def test_already_converted_passthrough(self):
+        tv = TimeValue('pct', 25.0)
+        assert self._convert(tv) is tv
 
     def test_none_passthrough(self):
         assert self._convert(None) is None
@@ -41,5 +45,11 @@ class TestResolve:
     def test_negative_seconds(self):
         assert resolve("-2.0", 10.0) == -2.0
 
+    def test_parsed_seconds(self):
+        assert resolve(TimeValue('sec', 1.5), 10.0) == 1.5
+
+    def test_parsed_percentage(self):
+        assert resolve(TimeValue('pct', 50.0), 10.0) == pytest.approx(5.0)
+
     def test_none(self):
         assert resolve(None, 10.0) is None